@@ -89,12 +89,14 @@ def _DiscoverMethods(queryOrMutationType):
 def _PrintMethod(queryOrMutation, operationName, parameters, description, returnType):
     if queryOrMutation == 'query' and operationName.startswith("List"):
         print('    @UseLazyGraphQuery')
-    builtinParameterNames = ('fields', 'timeout')
+    builtinParameterNames = ('fields', 'timeout', 'cache')
+    # only query results can be cached, mutations always call webstack
+    canCache = queryOrMutation == 'query'
     print('    def %s(self, %s):' % (operationName, ', '.join([
         '%s=None' % parameter['parameterName'] if parameter['parameterNullable'] else parameter['parameterName']
         for parameter in parameters
         if parameter['parameterName'] not in builtinParameterNames
-    ] + ['fields=None', 'timeout=None'])))
+    ] + ['fields=None', 'timeout=None'] + (['cache=False'] if canCache else []))))
     if description:
         print('        """%s' % description)
         print('')
@@ -106,6 +108,8 @@ def _PrintMethod(queryOrMutation, operationName, parameters, description, return
             print('            %s (%s%s): %s' % (parameter['parameterName'], _FormatTypeForDocstring(parameter['parameterType']), isOptionalString, _IndentNewlines(parameter['parameterDescription'])))
         print('            fields (list or dict, optional): Specifies a subset of fields to return.')
         print('            timeout (float, optional): Number of seconds to wait for response.')
+        if canCache:
+            print('            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.')
         print('')
         print('        Returns:')
         print('            %s: %s' % (_FormatTypeForDocstring(returnType['typeName']), _IndentNewlines(returnType['description'])))
@@ -116,7 +120,7 @@ def _PrintMethod(queryOrMutation, operationName, parameters, description, return
             continue
         print('            (\'%s\', \'%s\', %s),' % (parameter['parameterName'], parameter['parameterType'], parameter['parameterName']))
     print('        ]')
-    print('        return self._CallSimpleGraphAPI(\'%s\', operationName=\'%s\', parameterNameTypeValues=parameterNameTypeValues, returnType=\'%s\', fields=fields, timeout=timeout)' % (queryOrMutation, operationName, returnType['baseTypeName']))
+    print('        return self._CallSimpleGraphAPI(\'%s\', operationName=\'%s\', parameterNameTypeValues=parameterNameTypeValues, returnType=\'%s\', fields=fields, timeout=timeout%s)' % (queryOrMutation, operationName, returnType['baseTypeName'], ', cache=cache' if canCache else ''))
 
 def _PrintClient(serverVersion, queryMethods, mutationMethods):
     print('# -*- coding: utf-8 -*-')
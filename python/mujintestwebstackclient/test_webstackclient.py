@@ -3,13 +3,15 @@
 import pytest
 import requests_mock
 import random
+import threading
 import sys
 import copy
 import graphql
 
+from mujinwebstackclient import ControllerGraphClientException, WebstackClientError
 from mujinwebstackclient.webstackclient import WebstackClient
 from mujinwebstackclient.webstackclientutils import QueryIterator, GetMaximumQueryLimit
-from mujinwebstackclient.webstackgraphclientutils import GraphQueryIterator
+from mujinwebstackclient.webstackgraphclientutils import GraphQueryIterator, PrepareFields, _StringifyQueryFields
 
 def _RegisterMockGetScenesAPI(mocker, totalCount):
     """Dynamically mocks the webstack GetScenes API
@@ -327,6 +329,312 @@ def test_GraphQueryIteratorAndLazyGraphQuery():
             }
         }
 
+def test_GraphQueryIteratorProperties():
+    totalCount = 10
+    webstackclient = WebstackClient('http://controller', 'mujin', 'mujin')
+
+    with requests_mock.Mocker() as mock:
+        _RegisterMockListEnvironmentsAPI(mock, totalCount)
+
+        iterator = GraphQueryIterator(webstackclient.graphApi.ListEnvironments, fields={'environments': {'id': None}, 'meta': {'totalCount': None}})
+        assert iterator.keyName is None
+        assert iterator.totalCount is None
+        assert next(iterator) == {'id': '0'}
+        assert iterator.keyName == 'environments'
+        assert iterator.totalCount == totalCount
+        assert len(list(iterator)) == totalCount - 1
+
+def test_GraphQueryIteratorWithCursor():
+    totalCount = 2500
+    queriedOptions = []
+
+    def _ListItems(options=None, fields=None):
+        queriedOptions.append(dict(options))
+        assert 'pageInfo {endCursor, hasNextPage}' in fields
+        start = int(options['after']) if 'after' in options else options['offset']
+        end = min(start + options['first'], totalCount)
+        return {
+            'items': [{'id': str(index)} for index in range(start, end)],
+            'pageInfo': {'endCursor': str(end), 'hasNextPage': end < totalCount},
+        }
+
+    items = list(GraphQueryIterator(_ListItems, fields={'items': {'id': None}}, cursorField='after'))
+    assert [item['id'] for item in items] == [str(index) for index in range(totalCount)]
+    assert queriedOptions == [
+        {'offset': 0, 'first': 1000},
+        {'after': '1000', 'first': 1000},
+        {'after': '2000', 'first': 1000},
+    ]
+
+@pytest.mark.parametrize('hasNextPage, expectedCount, expectedOptions', [
+    # webstack has no more items, so stop even though the page is full
+    (False, 2000, [{'offset': 0, 'first': 1000}, {'after': '1000', 'first': 1000}]),
+    # webstack has more items, so fall back to offset
+    (True, 2500, [{'offset': 0, 'first': 1000}, {'after': '1000', 'first': 1000}, {'offset': 2000, 'first': 1000}]),
+])
+def test_GraphQueryIteratorWithoutEndCursor(hasNextPage, expectedCount, expectedOptions):
+    totalCount = 2500
+    queriedOptions = []
+
+    def _ListItems(options=None, fields=None):
+        queriedOptions.append(dict(options))
+        start = int(options['after']) if 'after' in options else options['offset']
+        end = min(start + options['first'], totalCount)
+        if start == 0:
+            pageInfo = {'endCursor': str(end), 'hasNextPage': True}
+        else:
+            # webstack stops returning the cursor after the first page
+            pageInfo = {'endCursor': None, 'hasNextPage': hasNextPage if end < totalCount else False}
+        return {
+            'items': [{'id': str(index)} for index in range(start, end)],
+            'pageInfo': pageInfo,
+        }
+
+    items = list(GraphQueryIterator(_ListItems, fields={'items': {'id': None}}, cursorField='after'))
+    assert [item['id'] for item in items] == [str(index) for index in range(expectedCount)]
+    assert queriedOptions == expectedOptions
+
+def _CreateFailingListItems(totalCount, failingOffset):
+    """Creates a query function listing totalCount items, which fails once when querying from failingOffset
+    """
+    failures = [failingOffset]
+
+    def _ListItems(options=None, fields=None):
+        if options['offset'] in failures:
+            failures.remove(options['offset'])
+            raise IOError('failed to query offset %d' % options['offset'])
+        start = options['offset']
+        return {'items': [{'id': str(index)} for index in range(start, min(start + options['first'], totalCount))]}
+
+    return _ListItems
+
+def test_GraphQueryIteratorRetryAfterFailure():
+    totalCount = 2500
+    iterator = GraphQueryIterator(_CreateFailingListItems(totalCount, 1000), fields={'items': {'id': None}})
+    items = []
+    with pytest.raises(IOError):
+        for item in iterator:
+            items.append(item)
+    assert len(items) == 1000
+
+    # retrying queries the failed page again
+    items.extend(iterator)
+    assert [item['id'] for item in items] == [str(index) for index in range(totalCount)]
+
+def test_GraphQueryIteratorPrefetch():
+    totalCount = 2500
+    webstackclient = WebstackClient('http://controller', 'mujin', 'mujin')
+
+    with requests_mock.Mocker() as mock:
+        _RegisterMockListEnvironmentsAPI(mock, totalCount)
+
+        environments = list(GraphQueryIterator(webstackclient.graphApi.ListEnvironments, fields={'environments': {'id': None}}, prefetch=True))
+        assert [environment['id'] for environment in environments] == [str(index) for index in range(totalCount)]
+
+        environments = list(GraphQueryIterator(webstackclient.graphApi.ListEnvironments, fields={'environments': {'id': None}}, options={'offset': 5, 'first': 1555}, prefetch=True))
+        assert [environment['id'] for environment in environments] == [str(index + 5) for index in range(1555)]
+
+def test_GraphQueryWithPreparedFields():
+    totalCount = 1500
+    webstackclient = WebstackClient('http://controller', 'mujin', 'mujin')
+
+    fields = PrepareFields({'environments': {'id': None}})
+    assert fields == '{environments {id}}'
+    assert PrepareFields(fields) == fields
+
+    with requests_mock.Mocker() as mock:
+        _RegisterMockListEnvironmentsAPI(mock, totalCount)
+
+        environments = list(GraphQueryIterator(webstackclient.graphApi.ListEnvironments, fields=fields))
+        assert [environment['id'] for environment in environments] == [str(index) for index in range(totalCount)]
+
+        # lazy query needs to add meta to fields, so prepared fields are rejected
+        with pytest.raises(WebstackClientError):
+            webstackclient.graphApi.ListEnvironments(fields=fields, options={'offset': 2, 'first': 2})
+
+def test_GraphQueryIteratorPrefetchOverlap():
+    totalCount = 2500
+    secondPageQueried = threading.Event()
+
+    def _ListItems(options=None, fields=None):
+        if options['offset'] == 1000:
+            secondPageQueried.set()
+        start = options['offset']
+        return {'items': [{'id': str(index)} for index in range(start, min(start + options['first'], totalCount))]}
+
+    iterator = GraphQueryIterator(_ListItems, fields={'items': {'id': None}}, prefetch=True)
+    assert next(iterator) == {'id': '0'}
+    # the second page is queried while the first page is still being consumed
+    assert secondPageQueried.wait(5)
+    assert len(list(iterator)) == totalCount - 1
+
+def test_GraphQueryIteratorPrefetchFailure():
+    totalCount = 2500
+    iterator = GraphQueryIterator(_CreateFailingListItems(totalCount, 1000), fields={'items': {'id': None}}, prefetch=True)
+    items = []
+    # the error raised by the background query reaches the caller when the page is needed
+    with pytest.raises(IOError):
+        for item in iterator:
+            items.append(item)
+    assert len(items) == 1000
+
+    # retrying queries the failed page again
+    items.extend(iterator)
+    assert [item['id'] for item in items] == [str(index) for index in range(totalCount)]
+
+def test_GraphQueryIteratorPrefetchClose():
+    queryFinished = threading.Event()
+
+    def _ListItems(options=None, fields=None):
+        if options['offset'] > 0:
+            # slow background query
+            threading.Event().wait(0.2)
+            queryFinished.set()
+        start = options['offset']
+        return {'items': [{'id': str(index)} for index in range(start, start + options['first'])]}
+
+    iterator = GraphQueryIterator(_ListItems, fields={'items': {'id': None}}, prefetch=True)
+    for item in iterator:
+        break
+    assert not queryFinished.is_set()
+
+    # closing waits for the background query so that it no longer uses the http session
+    iterator.close()
+    assert queryFinished.is_set()
+    assert list(iterator) == []
+
+def test_GraphQueryKeepsCallerArguments():
+    totalCount = 10
+    webstackclient = WebstackClient('http://controller', 'mujin', 'mujin')
+
+    with requests_mock.Mocker() as mock:
+        _RegisterMockListEnvironmentsAPI(mock, totalCount)
+
+        fields = {'environments': {'id': None}, 'meta': {}}
+        options = {'offset': 2, 'first': 5}
+        assert len(list(GraphQueryIterator(webstackclient.graphApi.ListEnvironments, fields=fields, options=options))) == 5
+        assert len(webstackclient.graphApi.ListEnvironments(fields=fields, options=options)['environments']) == 5
+        assert fields == {'environments': {'id': None}, 'meta': {}}
+        assert options == {'offset': 2, 'first': 5}
+
+def test_LazyGraphQueryReusesBuffer():
+    totalCount = 10
+    webstackclient = WebstackClient('http://controller', 'mujin', 'mujin')
+
+    # the initial query already has every requested item
+    with requests_mock.Mocker() as mock:
+        _RegisterMockListEnvironmentsAPI(mock, totalCount)
+        environments = webstackclient.graphApi.ListEnvironments(fields={'environments': {'id': None}}, options={'offset': 3, 'first': 1})['environments']
+        assert [environment['id'] for environment in environments] == ['3']
+        assert mock.call_count == 1
+
+    # the remaining items are queried starting after the buffered item
+    initialOffset = 3
+    with requests_mock.Mocker() as mock:
+        _RegisterMockListEnvironmentsAPI(mock, totalCount)
+        environments = webstackclient.graphApi.ListEnvironments(fields={'environments': {'id': None}}, options={'offset': initialOffset})['environments']
+        assert [environment['id'] for environment in environments] == [str(index) for index in range(initialOffset, totalCount)]
+        assert mock.call_count == 2
+        assert mock.request_history[1].json()['variables']['options']['offset'] == initialOffset + 1
+
+def test_CallBatchedGraphAPI():
+    webstackclient = WebstackClient('http://controller', 'mujin', 'mujin')
+
+    def _GetResponse(request, context):
+        context.status_code = 200
+        results = []
+        for item in request.json():
+            query = graphql.parse(item['query']).definitions[0]
+            operationName = query.selection_set.selections[0].name.value
+            assert operationName == item['operationName']
+            if operationName == 'GetEnvironment':
+                results.append({'data': {operationName: {'id': item['variables']['environmentId']}}})
+            else:
+                results.append({'data': None, 'errors': [{'message': 'unknown operation'}]})
+        return results
+
+    with requests_mock.Mocker() as mock:
+        mock.post('http://controller/api/v2/graphql', json=_GetResponse)
+
+        results = webstackclient.graphApi._CallBatchedGraphAPI([
+            ('query', 'GetEnvironment', [('environmentId', 'String!', 'env1')], 'Environment', {'id': None}),
+            ('query', 'GetEnvironment', [('environmentId', 'String!', 'env2')], 'Environment', {'id': None}),
+        ])
+        assert results == [{'id': 'env1'}, {'id': 'env2'}]
+        assert mock.call_count == 1
+
+        with pytest.raises(ControllerGraphClientException):
+            webstackclient.graphApi._CallBatchedGraphAPI([
+                ('query', 'GetEnvironment', [('environmentId', 'String!', 'env1')], 'Environment', {'id': None}),
+                ('query', 'GetUnknown', [], 'Environment', {'id': None}),
+            ])
+
+def test_CallSimpleGraphAPIWithCache():
+    totalCount = 10
+    webstackclient = WebstackClient('http://controller', 'mujin', 'mujin')
+    parameterNameTypeValues = [('options', 'ListOptionsInput', {'offset': 0, 'first': 2})]
+
+    with requests_mock.Mocker() as mock:
+        _RegisterMockListEnvironmentsAPI(mock, totalCount)
+
+        result = webstackclient.graphApi._CallSimpleGraphAPI('query', 'ListEnvironments', parameterNameTypeValues, 'ListEnvironmentsReturnValue', fields={'environments': {'id': None}}, cache=True)
+        assert result == {'environments': [{'id': '0'}, {'id': '1'}]}
+        result['environments'].pop()
+
+        # identical query is served from cache and not affected by modifying the previous result
+        result = webstackclient.graphApi._CallSimpleGraphAPI('query', 'ListEnvironments', parameterNameTypeValues, 'ListEnvironmentsReturnValue', fields={'environments': {'id': None}}, cache=True)
+        assert result == {'environments': [{'id': '0'}, {'id': '1'}]}
+        assert mock.call_count == 1
+
+        # different variables are queried again
+        webstackclient.graphApi._CallSimpleGraphAPI('query', 'ListEnvironments', [('options', 'ListOptionsInput', {'offset': 2, 'first': 2})], 'ListEnvironmentsReturnValue', fields={'environments': {'id': None}}, cache=True)
+        assert mock.call_count == 2
+
+        # without cache, always query
+        webstackclient.graphApi._CallSimpleGraphAPI('query', 'ListEnvironments', parameterNameTypeValues, 'ListEnvironmentsReturnValue', fields={'environments': {'id': None}})
+        assert mock.call_count == 3
+
+    # mutations sent in a batch clear the cache
+    with requests_mock.Mocker() as mock:
+        _RegisterMockListEnvironmentsAPI(mock, totalCount)
+        webstackclient.graphApi._CallSimpleGraphAPI('query', 'ListEnvironments', parameterNameTypeValues, 'ListEnvironmentsReturnValue', fields={'environments': {'id': None}}, cache=True)
+        assert mock.call_count == 0
+
+        mock.post('http://controller/api/v2/graphql', json=[{'data': {'DeleteEnvironment': None}}])
+        webstackclient.graphApi._CallBatchedGraphAPI([
+            ('mutation', 'DeleteEnvironment', [('environmentId', 'String!', 'env1')], 'Void', None),
+        ])
+        _RegisterMockListEnvironmentsAPI(mock, totalCount)
+        webstackclient.graphApi._CallSimpleGraphAPI('query', 'ListEnvironments', parameterNameTypeValues, 'ListEnvironmentsReturnValue', fields={'environments': {'id': None}}, cache=True)
+        assert mock.call_count == 2
+
+    # generated query methods pass cache through
+    with requests_mock.Mocker() as mock:
+        _RegisterMockListEnvironmentsAPI(mock, totalCount)
+        environments = webstackclient.graphApi.ListEnvironments(fields={'environments': {'id': None}}, options={'first': 3}, cache=True)['environments']
+        assert [environment['id'] for environment in environments] == ['0', '1', '2']
+        callCount = mock.call_count
+        assert callCount > 0
+        environments = webstackclient.graphApi.ListEnvironments(fields={'environments': {'id': None}}, options={'first': 3}, cache=True)['environments']
+        assert [environment['id'] for environment in environments] == ['0', '1', '2']
+        assert mock.call_count == callCount
+
+@pytest.mark.parametrize('fields, expectedKeys', [
+    ({'meta': {}}, []),
+    ({'meta': None}, []),
+    (['meta'], []),
+    ({'environments': {'id': None}, 'meta': None}, ['environments']),
+])
+def test_LazyGraphQueryMetaWithoutSubfields(fields, expectedKeys):
+    webstackclient = WebstackClient('http://controller', 'mujin', 'mujin')
+
+    with requests_mock.Mocker() as mock:
+        _RegisterMockListEnvironmentsAPI(mock, 10)
+        queryResult = webstackclient.graphApi.ListEnvironments(fields=fields)
+        assert sorted(queryResult) == expectedKeys
+        assert 'meta {totalCount}' in mock.request_history[0].json()['query']
+        assert mock.call_count == 1
+
 def test_LazyQueryStandardListOperations():
     """test standard list operations
     """
@@ -477,3 +785,14 @@ def test_LazyQueryStandardListOperations():
         del scenes[start:end]
         del expectedScenes[start:end]
         assert scenes == expectedScenes
+
+@pytest.mark.parametrize('fields, expected', [
+    (['id', 'name'], '{id, name}'),
+    ({'id': None, 'name': None}, '{id, name}'),
+    ({'environments': {'id': None, 'bodies': ['id', 'name']}}, '{environments {id, bodies {id, name}}}'),
+    ({'environments': {'id': None}, 'meta': {'totalCount': None}}, '{environments {id}, meta {totalCount}}'),
+])
+def test_StringifyQueryFields(fields, expected):
+    # run twice to cover the cached result
+    assert _StringifyQueryFields(fields) == expected
+    assert _StringifyQueryFields(fields) == expected
@@ -208,6 +208,43 @@ class ControllerWebClientRaw(object):
         return content
 
     def CallGraphAPI(self, query, variables=None, headers=None, timeout=5.0):
+        response, raw, content = self._PostGraphAPI({
+            'query': query,
+            'variables': variables or {},
+        }, headers=headers, timeout=timeout)
+        return self._GetGraphData(response, raw, content)
+
+    def CallBatchedGraphAPI(self, queries, headers=None, timeout=5.0):
+        """Sends multiple graph queries in a single request, requires the server to support batching.
+
+        Args:
+            queries (list): list of tuple (query, variables, operationName), operationName can be None
+            headers (dict): additional headers
+            timeout (float): timeout in seconds
+
+        Returns:
+            list: data of each query, in the same order as queries
+        """
+        response, raw, content = self._PostGraphAPI([
+            {
+                'query': query,
+                'variables': variables or {},
+                'operationName': operationName,
+            }
+            for query, variables, operationName in queries
+        ], headers=headers, timeout=timeout)
+
+        if not isinstance(content, list) or len(content) != len(queries):
+            if isinstance(content, dict):
+                # server might reject the whole batch with a single error
+                self._GetGraphData(response, raw, content)
+            raise ControllerGraphClientException(_('Unexpected server response %d: %s') % (response.status_code, raw), statusCode=response.status_code, response=response)
+
+        return [self._GetGraphData(response, raw, result) for result in content]
+
+    def _PostGraphAPI(self, body, headers=None, timeout=5.0):
+        """Posts the body to graph api, returns a tuple of response, raw content and decoded content
+        """
         # prepare the headers
         if headers is None:
             headers = {}
@@ -215,10 +252,7 @@ class ControllerWebClientRaw(object):
         headers['Accept'] = 'application/json'
 
         # make the request
-        response = self.Request('POST', '/api/v2/graphql', headers=headers, data=json.dumps({
-            'query': query,
-            'variables': variables or {},
-        }), timeout=timeout)
+        response = self.Request('POST', '/api/v2/graphql', headers=headers, data=json.dumps(body), timeout=timeout)
 
         # try to parse response
         raw = response.content.decode('utf-8', 'replace').strip()
@@ -236,6 +270,13 @@ class ControllerWebClientRaw(object):
             except ValueError as e:
                 log.exception('caught exception parsing json response: %s: %s', e, raw)
 
+        return response, raw, content
+
+    def _GetGraphData(self, response, raw, content):
+        """Returns the data in the decoded content of one graph query, raises any error returned
+        """
+        statusCode = response.status_code
+
         # raise any error returned
         if content is not None and 'errors' in content and len(content['errors']) > 0:
             message = content['errors'][0].get('message', raw)
@@ -109,6 +109,7 @@ class WebstackClient(object):
             return self._meta['offset']
 
     _webclient = None
+    _graphApi = None  # GraphClient sharing the webclient, created on first use so that its query cache is kept
     _userinfo = None  # A dict storing user info, like locale
 
     controllerurl = ''  # URl to controller
@@ -162,6 +163,7 @@ class WebstackClient(object):
     def Destroy(self):
         self.SetDestroy()
 
+        self._graphApi = None
         if self._webclient is not None:
             self._webclient.Destroy()
             self._webclient = None
@@ -187,7 +189,9 @@ class WebstackClient(object):
 
     @property
     def graphApi(self):
-        return webstackgraphclient.GraphClient(self._webclient)
+        if self._graphApi is None:
+            self._graphApi = webstackgraphclient.GraphClient(self._webclient)
+        return self._graphApi
 
     def RestartController(self):
         """Restarts controller
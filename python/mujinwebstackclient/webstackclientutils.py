@@ -28,7 +28,9 @@ class QueryIterator:
     _queryFunction = None # the actual webstack client query function (e.g. client.GetScenes)
     _queryArgs = None # positional arguments supplied to the query function (e.g. scenepk)
     _queryKwargs = None # keyword arguments supplied to the query function (e.g. offset=10, limit=20)
-    _items = [] # internal buffer for items retrieved from webstack
+    _items = () # internal buffer for items retrieved from webstack, the page returned by the query function
+    _index = 0 # the index of the next item to return in internal buffer
+    _end = 0 # the number of items in internal buffer to return to user
     _shouldStop = False # boolean flag indicates whether need to query webstack again
     _initialLimit = None # the number of items user requests (0 means no limit)
     _count = 0 # the number of items already returned to user
@@ -68,9 +70,9 @@ class QueryIterator:
            Required by Python2
         """
         # return an item from internal buffer if buffer is not empty
-        if len(self._items) != 0:
-            item = self._items[0]
-            self._items = self._items[1:]
+        if self._index < self._end:
+            item = self._items[self._index]
+            self._index += 1
             self._count += 1
             return item
 
@@ -79,16 +81,20 @@ class QueryIterator:
             raise StopIteration
 
         # query webstack if buffer is empty
-        self._items = self._queryFunction(*self._queryArgs, **self._queryKwargs)
-        self._queryKwargs['offset'] += len(self._items)
+        items = self._queryFunction(*self._queryArgs, **self._queryKwargs)
+        self._queryKwargs['offset'] += len(items)
 
-        if len(self._items) < self._queryKwargs['limit']:
+        if len(items) < self._queryKwargs['limit']:
             # webstack does not have more items
             self._shouldStop = True
-        if self._initialLimit != 0 and self._count + len(self._items) >= self._initialLimit:
+        if self._initialLimit != 0 and self._count + len(items) >= self._initialLimit:
             # all remaining items user requests are in internal buffer, no need to query webstack again
             self._shouldStop = True
-            self._items = self._items[:self._initialLimit - self._count]
+            self._end = self._initialLimit - self._count
+        else:
+            self._end = len(items)
+        self._items = items
+        self._index = 0
 
         return self.next()
 
@@ -10,35 +10,35 @@ from .webstackgraphclientutils import UseLazyGraphQuery
 
 class GraphQueries:
 
-    def CommandPackingOrchestrator(self, orchestratorId, fields=None, timeout=None):
+    def CommandPackingOrchestrator(self, orchestratorId, fields=None, timeout=None, cache=False):
         parameterNameTypeValues = [
             ('orchestratorId', 'String!', orchestratorId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='CommandPackingOrchestrator', parameterNameTypeValues=parameterNameTypeValues, returnType='CommandPackingOrchestratorQueries', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='CommandPackingOrchestrator', parameterNameTypeValues=parameterNameTypeValues, returnType='CommandPackingOrchestratorQueries', fields=fields, timeout=timeout, cache=cache)
 
-    def CommandRobotBridgesEx(self, queueId=None, fields=None, timeout=None):
+    def CommandRobotBridgesEx(self, queueId=None, fields=None, timeout=None, cache=False):
         parameterNameTypeValues = [
             ('queueId', 'String', queueId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='CommandRobotBridgesEx', parameterNameTypeValues=parameterNameTypeValues, returnType='CommandRobotBridgesExQueries', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='CommandRobotBridgesEx', parameterNameTypeValues=parameterNameTypeValues, returnType='CommandRobotBridgesExQueries', fields=fields, timeout=timeout, cache=cache)
 
-    def CommandRobotBridgesV2(self, queueId=None, fields=None, timeout=None):
+    def CommandRobotBridgesV2(self, queueId=None, fields=None, timeout=None, cache=False):
         parameterNameTypeValues = [
             ('queueId', 'String', queueId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='CommandRobotBridgesV2', parameterNameTypeValues=parameterNameTypeValues, returnType='CommandRobotBridgesV2Queries', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='CommandRobotBridgesV2', parameterNameTypeValues=parameterNameTypeValues, returnType='CommandRobotBridgesV2Queries', fields=fields, timeout=timeout, cache=cache)
 
-    def ConfigureRobotBridgesEx(self, fields=None, timeout=None):
+    def ConfigureRobotBridgesEx(self, fields=None, timeout=None, cache=False):
         parameterNameTypeValues = [
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ConfigureRobotBridgesEx', parameterNameTypeValues=parameterNameTypeValues, returnType='ConfigureRobotBridgesExQueries', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ConfigureRobotBridgesEx', parameterNameTypeValues=parameterNameTypeValues, returnType='ConfigureRobotBridgesExQueries', fields=fields, timeout=timeout, cache=cache)
 
-    def ConfigureRobotBridgesV2(self, fields=None, timeout=None):
+    def ConfigureRobotBridgesV2(self, fields=None, timeout=None, cache=False):
         parameterNameTypeValues = [
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ConfigureRobotBridgesV2', parameterNameTypeValues=parameterNameTypeValues, returnType='ConfigureRobotBridgesV2Queries', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ConfigureRobotBridgesV2', parameterNameTypeValues=parameterNameTypeValues, returnType='ConfigureRobotBridgesV2Queries', fields=fields, timeout=timeout, cache=cache)
 
-    def ExistEnvironment(self, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ExistEnvironment(self, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Check existence for a specific environment.
 
         Args:
@@ -47,6 +47,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             bool: The `Boolean` scalar type represents `true` or `false`.
@@ -56,9 +57,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ExistEnvironment', parameterNameTypeValues=parameterNameTypeValues, returnType='Boolean', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ExistEnvironment', parameterNameTypeValues=parameterNameTypeValues, returnType='Boolean', fields=fields, timeout=timeout, cache=cache)
 
-    def ExistEnvironments(self, environmentIds, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ExistEnvironments(self, environmentIds, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Check existence for multiple environments.
 
         Args:
@@ -67,6 +68,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             [Boolean]: The `Boolean` scalar type represents `true` or `false`.
@@ -76,15 +78,16 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ExistEnvironments', parameterNameTypeValues=parameterNameTypeValues, returnType='Boolean', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ExistEnvironments', parameterNameTypeValues=parameterNameTypeValues, returnType='Boolean', fields=fields, timeout=timeout, cache=cache)
 
-    def GetAlarmDefinition(self, alarmStatus, fields=None, timeout=None):
+    def GetAlarmDefinition(self, alarmStatus, fields=None, timeout=None, cache=False):
         """Get the alarm definition by the alarm status.
 
         Args:
             alarmStatus (AlarmStatus): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             AlarmDefinition: An alarm definition entry in the alarm library alarms
@@ -92,9 +95,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('alarmStatus', 'AlarmStatus!', alarmStatus),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetAlarmDefinition', parameterNameTypeValues=parameterNameTypeValues, returnType='AlarmDefinition', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetAlarmDefinition', parameterNameTypeValues=parameterNameTypeValues, returnType='AlarmDefinition', fields=fields, timeout=timeout, cache=cache)
 
-    def GetAppearanceParameters(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetAppearanceParameters(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get appearance parameters in a body.
 
         Args:
@@ -104,6 +107,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             AppearanceParameters: A set of parameters that vision detector uses.
@@ -114,15 +118,16 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetAppearanceParameters', parameterNameTypeValues=parameterNameTypeValues, returnType='AppearanceParameters', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetAppearanceParameters', parameterNameTypeValues=parameterNameTypeValues, returnType='AppearanceParameters', fields=fields, timeout=timeout, cache=cache)
 
-    def GetApplication(self, applicationId, fields=None, timeout=None):
+    def GetApplication(self, applicationId, fields=None, timeout=None, cache=False):
         """Get a specific application.
 
         Args:
             applicationId (str): ID of an existing application.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Application: Application for the frontend.
@@ -130,9 +135,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('applicationId', 'String!', applicationId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetApplication', parameterNameTypeValues=parameterNameTypeValues, returnType='Application', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetApplication', parameterNameTypeValues=parameterNameTypeValues, returnType='Application', fields=fields, timeout=timeout, cache=cache)
 
-    def GetApplicationConfigurationContent(self, applicationId, resolveReferences=None, fields=None, timeout=None):
+    def GetApplicationConfigurationContent(self, applicationId, resolveReferences=None, fields=None, timeout=None, cache=False):
         """Get application configuration without typing.
 
 
@@ -141,6 +146,7 @@ class GraphQueries:
             resolveReferences (bool, optional): Whether to operate on resolved configurations. Defaults to operate and return unresolved data.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Any: 
@@ -149,9 +155,9 @@ class GraphQueries:
             ('applicationId', 'String!', applicationId),
             ('resolveReferences', 'Boolean', resolveReferences),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetApplicationConfigurationContent', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetApplicationConfigurationContent', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout, cache=cache)
 
-    def GetAttachedSensor(self, attachedSensorId, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetAttachedSensor(self, attachedSensorId, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular attached sensor on a robot.
 
         Args:
@@ -162,6 +168,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             AttachedSensor: A sensor that is attached to a robot, e.g. a camera or a force sensor.
@@ -173,9 +180,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetAttachedSensor', parameterNameTypeValues=parameterNameTypeValues, returnType='AttachedSensor', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetAttachedSensor', parameterNameTypeValues=parameterNameTypeValues, returnType='AttachedSensor', fields=fields, timeout=timeout, cache=cache)
 
-    def GetBody(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetBody(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular body in an environment.
 
         Args:
@@ -185,6 +192,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Body: An OpenRAVE body in an environment. Can also describe a robot (a body with multiple links and joints)
@@ -195,9 +203,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetBody', parameterNameTypeValues=parameterNameTypeValues, returnType='Body', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetBody', parameterNameTypeValues=parameterNameTypeValues, returnType='Body', fields=fields, timeout=timeout, cache=cache)
 
-    def GetBodyParameters(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetBodyParameters(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a body parameters in a body.
 
         Args:
@@ -207,6 +215,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             BodyParameters: Parameters of an OpenRAVE 'Body'
@@ -217,9 +226,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetBodyParameters', parameterNameTypeValues=parameterNameTypeValues, returnType='BodyParameters', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetBodyParameters', parameterNameTypeValues=parameterNameTypeValues, returnType='BodyParameters', fields=fields, timeout=timeout, cache=cache)
 
-    def GetConfiguration(self, configurationId, resolveReferences=None, fields=None, timeout=None):
+    def GetConfiguration(self, configurationId, resolveReferences=None, fields=None, timeout=None, cache=False):
         """Get a particular configuration.
 
         Args:
@@ -227,6 +236,7 @@ class GraphQueries:
             resolveReferences (bool, optional): Whether to operate on resolved configurations. Defaults to operate and return unresolved data.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Configuration: 
@@ -235,9 +245,9 @@ class GraphQueries:
             ('configurationId', 'String!', configurationId),
             ('resolveReferences', 'Boolean', resolveReferences),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='Configuration', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='Configuration', fields=fields, timeout=timeout, cache=cache)
 
-    def GetConnectedBody(self, bodyId, connectedBodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetConnectedBody(self, bodyId, connectedBodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular connected body on a robot.
 
         Args:
@@ -248,6 +258,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ConnectedBody: A body that is connected to another.
@@ -259,15 +270,16 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetConnectedBody', parameterNameTypeValues=parameterNameTypeValues, returnType='ConnectedBody', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetConnectedBody', parameterNameTypeValues=parameterNameTypeValues, returnType='ConnectedBody', fields=fields, timeout=timeout, cache=cache)
 
-    def GetControllerSystemConfiguration(self, resolveReferences=None, fields=None, timeout=None):
+    def GetControllerSystemConfiguration(self, resolveReferences=None, fields=None, timeout=None, cache=False):
         """Get configurations for controller system.
 
         Args:
             resolveReferences (bool, optional): Whether to operate on resolved configurations. Defaults to operate and return unresolved data.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ControllerSystemConfiguration: 
@@ -275,15 +287,16 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('resolveReferences', 'Boolean', resolveReferences),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetControllerSystemConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='ControllerSystemConfiguration', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetControllerSystemConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='ControllerSystemConfiguration', fields=fields, timeout=timeout, cache=cache)
 
-    def GetDetectorModuleByDetectorID(self, detectorId, fields=None, timeout=None):
+    def GetDetectorModuleByDetectorID(self, detectorId, fields=None, timeout=None, cache=False):
         """Get detector module by detector id.
 
         Args:
             detectorId (str): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             DetectorModule: Detector module library type.
@@ -291,15 +304,16 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('detectorId', 'String!', detectorId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetDetectorModuleByDetectorID', parameterNameTypeValues=parameterNameTypeValues, returnType='DetectorModule', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetDetectorModuleByDetectorID', parameterNameTypeValues=parameterNameTypeValues, returnType='DetectorModule', fields=fields, timeout=timeout, cache=cache)
 
-    def GetDeviceBridgeModuleByDeviceBridgeType(self, deviceBridgeType, fields=None, timeout=None):
+    def GetDeviceBridgeModuleByDeviceBridgeType(self, deviceBridgeType, fields=None, timeout=None, cache=False):
         """Get device bridge module by device bridge type.
 
         Args:
             deviceBridgeType (str): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             DeviceBridgeModule: Device bridge module library type.
@@ -307,15 +321,16 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('deviceBridgeType', 'String!', deviceBridgeType),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetDeviceBridgeModuleByDeviceBridgeType', parameterNameTypeValues=parameterNameTypeValues, returnType='DeviceBridgeModule', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetDeviceBridgeModuleByDeviceBridgeType', parameterNameTypeValues=parameterNameTypeValues, returnType='DeviceBridgeModule', fields=fields, timeout=timeout, cache=cache)
 
-    def GetElectronicDataSheet(self, electronicDataSheetId, fields=None, timeout=None):
+    def GetElectronicDataSheet(self, electronicDataSheetId, fields=None, timeout=None, cache=False):
         """Get a specific electronic data sheet.
 
         Args:
             electronicDataSheetId (str): ID of the electronic data sheet.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ElectronicDataSheet: An EDS (Electronic Data Sheet) used for network configuration.
@@ -323,9 +338,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('electronicDataSheetId', 'String!', electronicDataSheetId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetElectronicDataSheet', parameterNameTypeValues=parameterNameTypeValues, returnType='ElectronicDataSheet', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetElectronicDataSheet', parameterNameTypeValues=parameterNameTypeValues, returnType='ElectronicDataSheet', fields=fields, timeout=timeout, cache=cache)
 
-    def GetEnvironment(self, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetEnvironment(self, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a specific environment.
 
         Args:
@@ -334,6 +349,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Environment: An OpenRAVE Environment
@@ -343,9 +359,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetEnvironment', parameterNameTypeValues=parameterNameTypeValues, returnType='Environment', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetEnvironment', parameterNameTypeValues=parameterNameTypeValues, returnType='Environment', fields=fields, timeout=timeout, cache=cache)
 
-    def GetEnvironments(self, environmentIds, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetEnvironments(self, environmentIds, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get multiple environments.
 
         Args:
@@ -354,6 +370,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             [Environment]: An OpenRAVE Environment
@@ -363,9 +380,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetEnvironments', parameterNameTypeValues=parameterNameTypeValues, returnType='Environment', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetEnvironments', parameterNameTypeValues=parameterNameTypeValues, returnType='Environment', fields=fields, timeout=timeout, cache=cache)
 
-    def GetFeedbackHistory(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetFeedbackHistory(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get feedback history in a body.
 
         Args:
@@ -375,6 +392,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             FeedbackHistory: The history of feedback from robotic system such as measured mass, final status of pick (success/piecelost etc.), options that were used for chucking etc.
@@ -385,9 +403,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetFeedbackHistory', parameterNameTypeValues=parameterNameTypeValues, returnType='FeedbackHistory', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetFeedbackHistory', parameterNameTypeValues=parameterNameTypeValues, returnType='FeedbackHistory', fields=fields, timeout=timeout, cache=cache)
 
-    def GetGeometry(self, bodyId, environmentId, geometryId, linkId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetGeometry(self, bodyId, environmentId, geometryId, linkId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular geometry in a link.
 
         Args:
@@ -399,6 +417,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Geometry: Geometry of a link. A link can have multiple geometries, and a body can have multiple links. All geometries of a link move together.
@@ -411,9 +430,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetGeometry', parameterNameTypeValues=parameterNameTypeValues, returnType='Geometry', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetGeometry', parameterNameTypeValues=parameterNameTypeValues, returnType='Geometry', fields=fields, timeout=timeout, cache=cache)
 
-    def GetGrabbed(self, bodyId, environmentId, grabbedId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetGrabbed(self, bodyId, environmentId, grabbedId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular grabbed object in a body.
 
         Args:
@@ -424,6 +443,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Grabbed: An object that is currently grabbed (grasped) by the robot.
@@ -435,9 +455,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetGrabbed', parameterNameTypeValues=parameterNameTypeValues, returnType='Grabbed', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetGrabbed', parameterNameTypeValues=parameterNameTypeValues, returnType='Grabbed', fields=fields, timeout=timeout, cache=cache)
 
-    def GetGraspSet(self, bodyId, environmentId, graspSetId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetGraspSet(self, bodyId, environmentId, graspSetId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular grasp set in a body.
 
         Args:
@@ -448,6 +468,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             GraspSet: Represents a set of IKParams at which an object may be grasped.
@@ -459,15 +480,16 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetGraspSet', parameterNameTypeValues=parameterNameTypeValues, returnType='GraspSet', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetGraspSet', parameterNameTypeValues=parameterNameTypeValues, returnType='GraspSet', fields=fields, timeout=timeout, cache=cache)
 
-    def GetGripperBridgeModuleByGripperBridgeType(self, gripperBridgeType, fields=None, timeout=None):
+    def GetGripperBridgeModuleByGripperBridgeType(self, gripperBridgeType, fields=None, timeout=None, cache=False):
         """Get gripper bridge module by gripper bridge type.
 
         Args:
             gripperBridgeType (str): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             GripperBridgeModule: Gripper bridge module library type.
@@ -475,9 +497,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('gripperBridgeType', 'String!', gripperBridgeType),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetGripperBridgeModuleByGripperBridgeType', parameterNameTypeValues=parameterNameTypeValues, returnType='GripperBridgeModule', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetGripperBridgeModuleByGripperBridgeType', parameterNameTypeValues=parameterNameTypeValues, returnType='GripperBridgeModule', fields=fields, timeout=timeout, cache=cache)
 
-    def GetGripperInfo(self, bodyId, environmentId, gripperInfoId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetGripperInfo(self, bodyId, environmentId, gripperInfoId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular gripper info on a robot.
 
         Args:
@@ -488,6 +510,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             GripperInfo: Gripper info describing the gripper properties, used for planning gripper operations.
@@ -499,51 +522,54 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetGripperInfo', parameterNameTypeValues=parameterNameTypeValues, returnType='GripperInfo', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetGripperInfo', parameterNameTypeValues=parameterNameTypeValues, returnType='GripperInfo', fields=fields, timeout=timeout, cache=cache)
 
-    def GetHypervisorCapabilities(self, fields=None, timeout=None):
+    def GetHypervisorCapabilities(self, fields=None, timeout=None, cache=False):
         """Get capabilities supported by hypervisor.
 
         Args:
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             [String]: The `String` scalar type represents textual data, represented as UTF-8 character sequences. The String type is most often used by GraphQL to represent free-form human-readable text.
         """
         parameterNameTypeValues = [
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetHypervisorCapabilities', parameterNameTypeValues=parameterNameTypeValues, returnType='String', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetHypervisorCapabilities', parameterNameTypeValues=parameterNameTypeValues, returnType='String', fields=fields, timeout=timeout, cache=cache)
 
-    def GetHypervisorStatus(self, fields=None, timeout=None):
+    def GetHypervisorStatus(self, fields=None, timeout=None, cache=False):
         """Get status of hypervisor.
 
         Args:
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             HypervisorStatus: Hypervisor status
         """
         parameterNameTypeValues = [
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetHypervisorStatus', parameterNameTypeValues=parameterNameTypeValues, returnType='HypervisorStatus', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetHypervisorStatus', parameterNameTypeValues=parameterNameTypeValues, returnType='HypervisorStatus', fields=fields, timeout=timeout, cache=cache)
 
-    def GetHypervisorVersion(self, fields=None, timeout=None):
+    def GetHypervisorVersion(self, fields=None, timeout=None, cache=False):
         """Get version of hypervisor.
 
         Args:
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             str: The `String` scalar type represents textual data, represented as UTF-8 character sequences. The String type is most often used by GraphQL to represent free-form human-readable text.
         """
         parameterNameTypeValues = [
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetHypervisorVersion', parameterNameTypeValues=parameterNameTypeValues, returnType='String', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetHypervisorVersion', parameterNameTypeValues=parameterNameTypeValues, returnType='String', fields=fields, timeout=timeout, cache=cache)
 
-    def GetIKParameterization(self, bodyId, environmentId, ikParamId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetIKParameterization(self, bodyId, environmentId, ikParamId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular ikparam in a body.
 
         Args:
@@ -554,6 +580,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             IKParameterization: Inverse Kinematics Parameterization describes a pose in space. Includes additional parameters that can affect grasping (e.g. Direction, Angle).
@@ -565,9 +592,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetIKParameterization', parameterNameTypeValues=parameterNameTypeValues, returnType='IKParameterization', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetIKParameterization', parameterNameTypeValues=parameterNameTypeValues, returnType='IKParameterization', fields=fields, timeout=timeout, cache=cache)
 
-    def GetJoint(self, bodyId, environmentId, jointId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetJoint(self, bodyId, environmentId, jointId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular joint in a body.
 
         Args:
@@ -578,6 +605,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Joint: Joint in a body, which connects a parent link and a child link. Can have multiple degrees of freedom.
@@ -589,9 +617,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetJoint', parameterNameTypeValues=parameterNameTypeValues, returnType='Joint', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetJoint', parameterNameTypeValues=parameterNameTypeValues, returnType='Joint', fields=fields, timeout=timeout, cache=cache)
 
-    def GetLink(self, bodyId, environmentId, linkId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetLink(self, bodyId, environmentId, linkId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular link in a body.
 
         Args:
@@ -602,6 +630,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Link: Link of a body, containing geometries. Links can be connected by joints.
@@ -613,15 +642,16 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetLink', parameterNameTypeValues=parameterNameTypeValues, returnType='Link', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetLink', parameterNameTypeValues=parameterNameTypeValues, returnType='Link', fields=fields, timeout=timeout, cache=cache)
 
-    def GetLogEntry(self, logEntryId, fields=None, timeout=None):
+    def GetLogEntry(self, logEntryId, fields=None, timeout=None, cache=False):
         """Get a particular log entry.
 
         Args:
             logEntryId (str): ID of the log entry.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             LogEntry: An entry in the logs. The current parent-children level relationship among log entry types:
@@ -690,9 +720,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('logEntryId', 'String!', logEntryId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetLogEntry', parameterNameTypeValues=parameterNameTypeValues, returnType='LogEntry', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetLogEntry', parameterNameTypeValues=parameterNameTypeValues, returnType='LogEntry', fields=fields, timeout=timeout, cache=cache)
 
-    def GetMesh(self, meshId, meshUnit=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetMesh(self, meshId, meshUnit=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular mesh.
 
         Args:
@@ -702,6 +732,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Mesh: Trangle mesh.
@@ -712,9 +743,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetMesh', parameterNameTypeValues=parameterNameTypeValues, returnType='Mesh', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetMesh', parameterNameTypeValues=parameterNameTypeValues, returnType='Mesh', fields=fields, timeout=timeout, cache=cache)
 
-    def GetModelProcessorProperties(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetModelProcessorProperties(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get model processor properties in a body.
 
         Args:
@@ -724,6 +755,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ModelProcessorProperties: A set of values related to the latest model processing state
@@ -734,9 +766,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetModelProcessorProperties', parameterNameTypeValues=parameterNameTypeValues, returnType='ModelProcessorProperties', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetModelProcessorProperties', parameterNameTypeValues=parameterNameTypeValues, returnType='ModelProcessorProperties', fields=fields, timeout=timeout, cache=cache)
 
-    def GetModelProcessorState(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetModelProcessorState(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get model processor state in a body.
 
         Args:
@@ -746,6 +778,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ModelProcessorState: A set of values related to the latest model processing state
@@ -756,30 +789,32 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetModelProcessorState', parameterNameTypeValues=parameterNameTypeValues, returnType='ModelProcessorState', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetModelProcessorState', parameterNameTypeValues=parameterNameTypeValues, returnType='ModelProcessorState', fields=fields, timeout=timeout, cache=cache)
 
-    def GetModelProcessorTaskState(self, fields=None, timeout=None):
+    def GetModelProcessorTaskState(self, fields=None, timeout=None, cache=False):
         """Get task state of model processor.
 
 
         Args:
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ModelProcessorTaskState: Current status of the model processor
         """
         parameterNameTypeValues = [
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetModelProcessorTaskState', parameterNameTypeValues=parameterNameTypeValues, returnType='ModelProcessorTaskState', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetModelProcessorTaskState', parameterNameTypeValues=parameterNameTypeValues, returnType='ModelProcessorTaskState', fields=fields, timeout=timeout, cache=cache)
 
-    def GetOrchestratorMasterConfiguration(self, resolveReferences=None, fields=None, timeout=None):
+    def GetOrchestratorMasterConfiguration(self, resolveReferences=None, fields=None, timeout=None, cache=False):
         """Get configurations for orchestrator master.
 
         Args:
             resolveReferences (bool, optional): Whether to operate on resolved configurations. Defaults to operate and return unresolved data.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             OrchestratorMasterConfiguration: Orchestrator master configuration.
@@ -787,15 +822,16 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('resolveReferences', 'Boolean', resolveReferences),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetOrchestratorMasterConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='OrchestratorMasterConfiguration', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetOrchestratorMasterConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='OrchestratorMasterConfiguration', fields=fields, timeout=timeout, cache=cache)
 
-    def GetOrchestratorModuleByOrchestratorType(self, orchestratorType, fields=None, timeout=None):
+    def GetOrchestratorModuleByOrchestratorType(self, orchestratorType, fields=None, timeout=None, cache=False):
         """Get orchestrator module by orchestrator type.
 
         Args:
             orchestratorType (str): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             OrchestratorModule: Orchestrator module library type.
@@ -803,9 +839,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('orchestratorType', 'String!', orchestratorType),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetOrchestratorModuleByOrchestratorType', parameterNameTypeValues=parameterNameTypeValues, returnType='OrchestratorModule', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetOrchestratorModuleByOrchestratorType', parameterNameTypeValues=parameterNameTypeValues, returnType='OrchestratorModule', fields=fields, timeout=timeout, cache=cache)
 
-    def GetPositionConfiguration(self, bodyId, environmentId, positionConfigurationId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetPositionConfiguration(self, bodyId, environmentId, positionConfigurationId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular position configuration in a body.
 
         Args:
@@ -816,6 +852,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             PositionConfiguration: A robot configuration defined via joint values.
@@ -827,29 +864,31 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetPositionConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='PositionConfiguration', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetPositionConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='PositionConfiguration', fields=fields, timeout=timeout, cache=cache)
 
-    def GetProfileSelectionOrder(self, fields=None, timeout=None):
+    def GetProfileSelectionOrder(self, fields=None, timeout=None, cache=False):
         """Get profile selection order.
 
         Args:
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             [String]: The `String` scalar type represents textual data, represented as UTF-8 character sequences. The String type is most often used by GraphQL to represent free-form human-readable text.
         """
         parameterNameTypeValues = [
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetProfileSelectionOrder', parameterNameTypeValues=parameterNameTypeValues, returnType='String', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetProfileSelectionOrder', parameterNameTypeValues=parameterNameTypeValues, returnType='String', fields=fields, timeout=timeout, cache=cache)
 
-    def GetProgram(self, programId, fields=None, timeout=None):
+    def GetProgram(self, programId, fields=None, timeout=None, cache=False):
         """Get a specific program.
 
         Args:
             programId (str): ID of the program.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Program: ITL program.
@@ -857,9 +896,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('programId', 'String!', programId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetProgram', parameterNameTypeValues=parameterNameTypeValues, returnType='Program', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetProgram', parameterNameTypeValues=parameterNameTypeValues, returnType='Program', fields=fields, timeout=timeout, cache=cache)
 
-    def GetProgramFilesAtReference(self, programId, referenceId, fields=None, timeout=None):
+    def GetProgramFilesAtReference(self, programId, referenceId, fields=None, timeout=None, cache=False):
         """Get all program files at a particular reference.
 
         Args:
@@ -867,6 +906,7 @@ class GraphQueries:
             referenceId (str): ID of the program reference.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             [ProgramFile]: 
@@ -875,15 +915,16 @@ class GraphQueries:
             ('programId', 'String!', programId),
             ('referenceId', 'String!', referenceId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetProgramFilesAtReference', parameterNameTypeValues=parameterNameTypeValues, returnType='ProgramFile', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetProgramFilesAtReference', parameterNameTypeValues=parameterNameTypeValues, returnType='ProgramFile', fields=fields, timeout=timeout, cache=cache)
 
-    def GetProgramObject(self, objectId, fields=None, timeout=None):
+    def GetProgramObject(self, objectId, fields=None, timeout=None, cache=False):
         """Get single program object.
 
         Args:
             objectId (str): ID of the program object to retrieve.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ProgramObject: A blob, tree or commit object. Can be shared by multiple programs
@@ -891,9 +932,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('objectId', 'String!', objectId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetProgramObject', parameterNameTypeValues=parameterNameTypeValues, returnType='ProgramObject', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetProgramObject', parameterNameTypeValues=parameterNameTypeValues, returnType='ProgramObject', fields=fields, timeout=timeout, cache=cache)
 
-    def GetProgramReference(self, programId, referenceId, fields=None, timeout=None):
+    def GetProgramReference(self, programId, referenceId, fields=None, timeout=None, cache=False):
         """Get a specific program reference.
 
         Args:
@@ -901,6 +942,7 @@ class GraphQueries:
             referenceId (str): ID of the reference, "refs/heads/my-branch" for example.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ProgramReference: A named reference pointing to a commit object.
@@ -909,15 +951,16 @@ class GraphQueries:
             ('programId', 'String!', programId),
             ('referenceId', 'String!', referenceId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetProgramReference', parameterNameTypeValues=parameterNameTypeValues, returnType='ProgramReference', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetProgramReference', parameterNameTypeValues=parameterNameTypeValues, returnType='ProgramReference', fields=fields, timeout=timeout, cache=cache)
 
-    def GetProviderBridgeModuleByProviderBridgeType(self, providerBridgeType, fields=None, timeout=None):
+    def GetProviderBridgeModuleByProviderBridgeType(self, providerBridgeType, fields=None, timeout=None, cache=False):
         """Get provider bridge module by provider bridge type.
 
         Args:
             providerBridgeType (str): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ProviderBridgeModule: Provider bridge module library type.
@@ -925,9 +968,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('providerBridgeType', 'String!', providerBridgeType),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetProviderBridgeModuleByProviderBridgeType', parameterNameTypeValues=parameterNameTypeValues, returnType='ProviderBridgeModule', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetProviderBridgeModuleByProviderBridgeType', parameterNameTypeValues=parameterNameTypeValues, returnType='ProviderBridgeModule', fields=fields, timeout=timeout, cache=cache)
 
-    def GetRevision(self, environmentId, revisionId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetRevision(self, environmentId, revisionId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular revision of an environment.
 
         Args:
@@ -937,6 +980,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Revision: Revision of an environment, contains backward and forward differences.
@@ -947,15 +991,16 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetRevision', parameterNameTypeValues=parameterNameTypeValues, returnType='Revision', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetRevision', parameterNameTypeValues=parameterNameTypeValues, returnType='Revision', fields=fields, timeout=timeout, cache=cache)
 
-    def GetRobotBridgeModuleByRobotBridgeType(self, robotBridgeType, fields=None, timeout=None):
+    def GetRobotBridgeModuleByRobotBridgeType(self, robotBridgeType, fields=None, timeout=None, cache=False):
         """Get robot bridge module by robot bridge type.
 
         Args:
             robotBridgeType (str): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             RobotBridgeModule: Robot bridge module library type.
@@ -963,15 +1008,16 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('robotBridgeType', 'String!', robotBridgeType),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetRobotBridgeModuleByRobotBridgeType', parameterNameTypeValues=parameterNameTypeValues, returnType='RobotBridgeModule', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetRobotBridgeModuleByRobotBridgeType', parameterNameTypeValues=parameterNameTypeValues, returnType='RobotBridgeModule', fields=fields, timeout=timeout, cache=cache)
 
-    def GetRobotBridgesConfiguration(self, resolveReferences=None, fields=None, timeout=None):
+    def GetRobotBridgesConfiguration(self, resolveReferences=None, fields=None, timeout=None, cache=False):
         """Get configurations for robotbridges.
 
         Args:
             resolveReferences (bool, optional): Whether to operate on resolved configurations. Defaults to operate and return unresolved data.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             RobotBridgesConfiguration: 
@@ -979,9 +1025,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('resolveReferences', 'Boolean', resolveReferences),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetRobotBridgesConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='RobotBridgesConfiguration', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetRobotBridgesConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='RobotBridgesConfiguration', fields=fields, timeout=timeout, cache=cache)
 
-    def GetRobotMotionParameters(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetRobotMotionParameters(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a robot motion parameters in a body.
 
         Args:
@@ -991,6 +1037,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             RobotMotionParameters: A set of parameters that constrain the motion of a robot, e.g. maximum tool (cartesian) speed and acceleration.
@@ -1003,15 +1050,16 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetRobotMotionParameters', parameterNameTypeValues=parameterNameTypeValues, returnType='RobotMotionParameters', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetRobotMotionParameters', parameterNameTypeValues=parameterNameTypeValues, returnType='RobotMotionParameters', fields=fields, timeout=timeout, cache=cache)
 
-    def GetSensorBridgeModuleBySensorBridgeType(self, sensorBridgeType, fields=None, timeout=None):
+    def GetSensorBridgeModuleBySensorBridgeType(self, sensorBridgeType, fields=None, timeout=None, cache=False):
         """Get sensor bridge module by sensor bridge type.
 
         Args:
             sensorBridgeType (str): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             SensorBridgeModule: Sensor bridge module library type.
@@ -1019,15 +1067,16 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('sensorBridgeType', 'String!', sensorBridgeType),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetSensorBridgeModuleBySensorBridgeType', parameterNameTypeValues=parameterNameTypeValues, returnType='SensorBridgeModule', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetSensorBridgeModuleBySensorBridgeType', parameterNameTypeValues=parameterNameTypeValues, returnType='SensorBridgeModule', fields=fields, timeout=timeout, cache=cache)
 
-    def GetSensorBridgesConfiguration(self, resolveReferences=None, fields=None, timeout=None):
+    def GetSensorBridgesConfiguration(self, resolveReferences=None, fields=None, timeout=None, cache=False):
         """Get configurations for sensorbridges.
 
         Args:
             resolveReferences (bool, optional): Whether to operate on resolved configurations. Defaults to operate and return unresolved data.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             SensorBridgesConfiguration: 
@@ -1035,9 +1084,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('resolveReferences', 'Boolean', resolveReferences),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetSensorBridgesConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='SensorBridgesConfiguration', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetSensorBridgesConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='SensorBridgesConfiguration', fields=fields, timeout=timeout, cache=cache)
 
-    def GetSignalMapConfiguration(self, configurationId, resolveReferences=None, fields=None, timeout=None):
+    def GetSignalMapConfiguration(self, configurationId, resolveReferences=None, fields=None, timeout=None, cache=False):
         """Get signal map.
 
         Args:
@@ -1045,6 +1094,7 @@ class GraphQueries:
             resolveReferences (bool, optional): Whether to operate on resolved configurations. Defaults to operate and return unresolved data.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             SignalMapConfiguration: 
@@ -1053,9 +1103,9 @@ class GraphQueries:
             ('configurationId', 'String!', configurationId),
             ('resolveReferences', 'Boolean', resolveReferences),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetSignalMapConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='SignalMapConfiguration', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetSignalMapConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='SignalMapConfiguration', fields=fields, timeout=timeout, cache=cache)
 
-    def GetTool(self, bodyId, environmentId, toolId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetTool(self, bodyId, environmentId, toolId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get a particular tool on a robot.
 
         Args:
@@ -1066,6 +1116,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Tool: Tool describes a manipulator coordinate system of a robot. Other frameworks may use the term "TCP" or "tool tip".
@@ -1077,9 +1128,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetTool', parameterNameTypeValues=parameterNameTypeValues, returnType='Tool', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetTool', parameterNameTypeValues=parameterNameTypeValues, returnType='Tool', fields=fields, timeout=timeout, cache=cache)
 
-    def GetUntypedAppearanceParameters(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetUntypedAppearanceParameters(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get untyped appearance parameters in a body.
 
         Args:
@@ -1089,6 +1140,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Any: 
@@ -1099,9 +1151,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetUntypedAppearanceParameters', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetUntypedAppearanceParameters', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout, cache=cache)
 
-    def GetUntypedApplicationConfiguration(self, applicationId, resolveReferences=None, fields=None, timeout=None):
+    def GetUntypedApplicationConfiguration(self, applicationId, resolveReferences=None, fields=None, timeout=None, cache=False):
         """Get application configuration without typing.
 
         Args:
@@ -1109,6 +1161,7 @@ class GraphQueries:
             resolveReferences (bool, optional): Whether to operate on resolved configurations. Defaults to operate and return unresolved data.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Any: 
@@ -1117,9 +1170,9 @@ class GraphQueries:
             ('applicationId', 'String!', applicationId),
             ('resolveReferences', 'Boolean', resolveReferences),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetUntypedApplicationConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetUntypedApplicationConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout, cache=cache)
 
-    def GetUntypedConfiguration(self, configurationId, ifModifiedSinceModifiedAt=None, resolveReferences=None, fields=None, timeout=None):
+    def GetUntypedConfiguration(self, configurationId, ifModifiedSinceModifiedAt=None, resolveReferences=None, fields=None, timeout=None, cache=False):
         """Get a particular configuration without typing.
 
         Args:
@@ -1128,6 +1181,7 @@ class GraphQueries:
             resolveReferences (bool, optional): Whether to operate on resolved configurations. Defaults to operate and return unresolved data.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Any: 
@@ -1137,15 +1191,16 @@ class GraphQueries:
             ('ifModifiedSinceModifiedAt', 'DateTime', ifModifiedSinceModifiedAt),
             ('resolveReferences', 'Boolean', resolveReferences),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetUntypedConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetUntypedConfiguration', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout, cache=cache)
 
-    def GetUntypedElectronicDataSheetConfigurationSchema(self, electronicDataSheetId, fields=None, timeout=None):
+    def GetUntypedElectronicDataSheetConfigurationSchema(self, electronicDataSheetId, fields=None, timeout=None, cache=False):
         """Get the configuration schema for a specific electronic data sheet.
 
         Args:
             electronicDataSheetId (str): ID of the electronic data sheet.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Any: 
@@ -1153,29 +1208,31 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('electronicDataSheetId', 'String!', electronicDataSheetId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetUntypedElectronicDataSheetConfigurationSchema', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetUntypedElectronicDataSheetConfigurationSchema', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout, cache=cache)
 
-    def GetUntypedHypervisorStatus(self, fields=None, timeout=None):
+    def GetUntypedHypervisorStatus(self, fields=None, timeout=None, cache=False):
         """Get untyped status of hypervisor.
 
         Args:
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Any: 
         """
         parameterNameTypeValues = [
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetUntypedHypervisorStatus', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetUntypedHypervisorStatus', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout, cache=cache)
 
-    def GetUntypedLogEntry(self, logEntryId, fields=None, timeout=None):
+    def GetUntypedLogEntry(self, logEntryId, fields=None, timeout=None, cache=False):
         """Get a particular log entry without typing.
 
         Args:
             logEntryId (str): ID of the log entry.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Any: 
@@ -1183,9 +1240,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('logEntryId', 'String!', logEntryId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetUntypedLogEntry', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetUntypedLogEntry', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout, cache=cache)
 
-    def GetUntypedModelProcessorProperties(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetUntypedModelProcessorProperties(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get untyped model processor properties in a body.
 
         Args:
@@ -1195,6 +1252,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Any: 
@@ -1205,9 +1263,9 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetUntypedModelProcessorProperties', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetUntypedModelProcessorProperties', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout, cache=cache)
 
-    def GetUntypedModelProcessorState(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None):
+    def GetUntypedModelProcessorState(self, bodyId, environmentId, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """Get untyped model processor state in a body.
 
         Args:
@@ -1217,6 +1275,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Any: 
@@ -1227,15 +1286,16 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetUntypedModelProcessorState', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetUntypedModelProcessorState', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout, cache=cache)
 
-    def GetUntypedSchema(self, schemaId, fields=None, timeout=None):
+    def GetUntypedSchema(self, schemaId, fields=None, timeout=None, cache=False):
         """Get untyped JSON schema by the schema ID.
 
         Args:
             schemaId (str): ID of the schema.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             Any: 
@@ -1243,15 +1303,16 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('schemaId', 'String!', schemaId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetUntypedSchema', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetUntypedSchema', parameterNameTypeValues=parameterNameTypeValues, returnType='Any', fields=fields, timeout=timeout, cache=cache)
 
-    def GetVisionTaskModuleByVisionTaskType(self, visionTaskType, fields=None, timeout=None):
+    def GetVisionTaskModuleByVisionTaskType(self, visionTaskType, fields=None, timeout=None, cache=False):
         """Get vision task module by vision task type.
 
         Args:
             visionTaskType (str): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             VisionTaskModule: Vision task module library type.
@@ -1259,23 +1320,24 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('visionTaskType', 'String!', visionTaskType),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetVisionTaskModuleByVisionTaskType', parameterNameTypeValues=parameterNameTypeValues, returnType='VisionTaskModule', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetVisionTaskModuleByVisionTaskType', parameterNameTypeValues=parameterNameTypeValues, returnType='VisionTaskModule', fields=fields, timeout=timeout, cache=cache)
 
-    def GetWebStackState(self, fields=None, timeout=None):
+    def GetWebStackState(self, fields=None, timeout=None, cache=False):
         """Get published component states of WebStack.
 
         Args:
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             WebStackState: WebStackState contains published component states of WebStack.
         """
         parameterNameTypeValues = [
         ]
-        return self._CallSimpleGraphAPI('query', operationName='GetWebStackState', parameterNameTypeValues=parameterNameTypeValues, returnType='WebStackState', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='GetWebStackState', parameterNameTypeValues=parameterNameTypeValues, returnType='WebStackState', fields=fields, timeout=timeout, cache=cache)
 
-    def IsAttachedSensorMoveable(self, attachedSensorName, bodyName, environmentId, fields=None, timeout=None):
+    def IsAttachedSensorMoveable(self, attachedSensorName, bodyName, environmentId, fields=None, timeout=None, cache=False):
         """Check and see if attached sensor is moveable on a robot
 
         Args:
@@ -1284,6 +1346,7 @@ class GraphQueries:
             environmentId (str): ID of the environment to check
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             bool: The `Boolean` scalar type represents `true` or `false`.
@@ -1293,9 +1356,9 @@ class GraphQueries:
             ('bodyName', 'String!', bodyName),
             ('environmentId', 'String!', environmentId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='IsAttachedSensorMoveable', parameterNameTypeValues=parameterNameTypeValues, returnType='Boolean', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='IsAttachedSensorMoveable', parameterNameTypeValues=parameterNameTypeValues, returnType='Boolean', fields=fields, timeout=timeout, cache=cache)
 
-    def IsSensorLinkMoveable(self, bodyName, environmentId, sensorLinkName, fields=None, timeout=None):
+    def IsSensorLinkMoveable(self, bodyName, environmentId, sensorLinkName, fields=None, timeout=None, cache=False):
         """Check and see if sensor link is moveable on a robot
 
         Args:
@@ -1304,6 +1367,7 @@ class GraphQueries:
             sensorLinkName (str): Name of the sensor link, could be in the format of "connectedBodyName_sensorLinkName"
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             bool: The `Boolean` scalar type represents `true` or `false`.
@@ -1313,16 +1377,17 @@ class GraphQueries:
             ('environmentId', 'String!', environmentId),
             ('sensorLinkName', 'String!', sensorLinkName),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='IsSensorLinkMoveable', parameterNameTypeValues=parameterNameTypeValues, returnType='Boolean', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='IsSensorLinkMoveable', parameterNameTypeValues=parameterNameTypeValues, returnType='Boolean', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListAlarmDefinitions(self, options=None, fields=None, timeout=None):
+    def ListAlarmDefinitions(self, options=None, fields=None, timeout=None, cache=False):
         """List all alarm definitions.
 
         Args:
             options (ListOptionsWithAggregationsInput, optional): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListAlarmDefinitionsReturnValue: 
@@ -1330,16 +1395,17 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsWithAggregationsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListAlarmDefinitions', parameterNameTypeValues=parameterNameTypeValues, returnType='ListAlarmDefinitionsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListAlarmDefinitions', parameterNameTypeValues=parameterNameTypeValues, returnType='ListAlarmDefinitionsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListApplications(self, options=None, fields=None, timeout=None):
+    def ListApplications(self, options=None, fields=None, timeout=None, cache=False):
         """List all applications.
 
         Args:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListApplicationsReturnValue: 
@@ -1347,10 +1413,10 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListApplications', parameterNameTypeValues=parameterNameTypeValues, returnType='ListApplicationsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListApplications', parameterNameTypeValues=parameterNameTypeValues, returnType='ListApplicationsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListAttachedSensors(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListAttachedSensors(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List attached sensors defined on a robot.
 
         Args:
@@ -1361,6 +1427,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListAttachedSensorsReturnValue: 
@@ -1372,10 +1439,10 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListAttachedSensors', parameterNameTypeValues=parameterNameTypeValues, returnType='ListAttachedSensorsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListAttachedSensors', parameterNameTypeValues=parameterNameTypeValues, returnType='ListAttachedSensorsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListBodies(self, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListBodies(self, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List bodies in an environment.
 
         Args:
@@ -1385,6 +1452,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListBodiesReturnValue: 
@@ -1395,10 +1463,10 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListBodies', parameterNameTypeValues=parameterNameTypeValues, returnType='ListBodiesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListBodies', parameterNameTypeValues=parameterNameTypeValues, returnType='ListBodiesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListConfigurations(self, options=None, resolveReferences=None, fields=None, timeout=None):
+    def ListConfigurations(self, options=None, resolveReferences=None, fields=None, timeout=None, cache=False):
         """List available configurations.
 
 
@@ -1407,6 +1475,7 @@ class GraphQueries:
             resolveReferences (bool, optional): Whether to operate on resolved configurations. Defaults to operate and return unresolved data.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListConfigurationsReturnValue: 
@@ -1415,10 +1484,10 @@ class GraphQueries:
             ('options', 'ListOptionsInput', options),
             ('resolveReferences', 'Boolean', resolveReferences),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListConfigurations', parameterNameTypeValues=parameterNameTypeValues, returnType='ListConfigurationsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListConfigurations', parameterNameTypeValues=parameterNameTypeValues, returnType='ListConfigurationsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListConfigurationsEx(self, options=None, resolveReferences=None, fields=None, timeout=None):
+    def ListConfigurationsEx(self, options=None, resolveReferences=None, fields=None, timeout=None, cache=False):
         """List available configurations using aggregation options.
 
         Args:
@@ -1426,6 +1495,7 @@ class GraphQueries:
             resolveReferences (bool, optional): Whether to operate on resolved configurations. Defaults to operate and return unresolved data.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListConfigurationsExReturnValue: 
@@ -1434,10 +1504,10 @@ class GraphQueries:
             ('options', 'ListOptionsWithAggregationsInput', options),
             ('resolveReferences', 'Boolean', resolveReferences),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListConfigurationsEx', parameterNameTypeValues=parameterNameTypeValues, returnType='ListConfigurationsExReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListConfigurationsEx', parameterNameTypeValues=parameterNameTypeValues, returnType='ListConfigurationsExReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListConnectedBodies(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListConnectedBodies(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List connected bodies defined on a robot.
 
         Args:
@@ -1448,6 +1518,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListConnectedBodiesReturnValue: 
@@ -1459,16 +1530,17 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListConnectedBodies', parameterNameTypeValues=parameterNameTypeValues, returnType='ListConnectedBodiesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListConnectedBodies', parameterNameTypeValues=parameterNameTypeValues, returnType='ListConnectedBodiesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListDetectorModules(self, options=None, fields=None, timeout=None):
+    def ListDetectorModules(self, options=None, fields=None, timeout=None, cache=False):
         """List detector modules.
 
         Args:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListDetectorModulesReturnValue: 
@@ -1476,16 +1548,17 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListDetectorModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListDetectorModulesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListDetectorModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListDetectorModulesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListDeviceBridgeModules(self, options=None, fields=None, timeout=None):
+    def ListDeviceBridgeModules(self, options=None, fields=None, timeout=None, cache=False):
         """List device bridge modules.
 
         Args:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListDeviceBridgeModulesReturnValue: 
@@ -1493,16 +1566,17 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListDeviceBridgeModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListDeviceBridgeModulesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListDeviceBridgeModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListDeviceBridgeModulesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListElectronicDataSheets(self, options=None, fields=None, timeout=None):
+    def ListElectronicDataSheets(self, options=None, fields=None, timeout=None, cache=False):
         """List available electronic data sheets.
 
         Args:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListElectronicDataSheetReturnValue: 
@@ -1510,10 +1584,10 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListElectronicDataSheets', parameterNameTypeValues=parameterNameTypeValues, returnType='ListElectronicDataSheetReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListElectronicDataSheets', parameterNameTypeValues=parameterNameTypeValues, returnType='ListElectronicDataSheetReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListEnvironments(self, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListEnvironments(self, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List all environments.
 
 
@@ -1523,6 +1597,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListEnvironmentsReturnValue: 
@@ -1532,10 +1607,10 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListEnvironments', parameterNameTypeValues=parameterNameTypeValues, returnType='ListEnvironmentsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListEnvironments', parameterNameTypeValues=parameterNameTypeValues, returnType='ListEnvironmentsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListEnvironmentsEx(self, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListEnvironmentsEx(self, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List environments with aggregations.
 
         Args:
@@ -1544,6 +1619,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListEnvironmentsExReturnValue: 
@@ -1553,10 +1629,10 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListEnvironmentsEx', parameterNameTypeValues=parameterNameTypeValues, returnType='ListEnvironmentsExReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListEnvironmentsEx', parameterNameTypeValues=parameterNameTypeValues, returnType='ListEnvironmentsExReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListGeometries(self, bodyId, environmentId, linkId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListGeometries(self, bodyId, environmentId, linkId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List geometries in a link.
 
         Args:
@@ -1568,6 +1644,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListGeometriesReturnValue: 
@@ -1580,10 +1657,10 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListGeometries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGeometriesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListGeometries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGeometriesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListGrabbeds(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListGrabbeds(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List grabbed objects in a body.
 
         Args:
@@ -1594,6 +1671,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListGrabbedsReturnValue: 
@@ -1605,10 +1683,10 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListGrabbeds', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGrabbedsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListGrabbeds', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGrabbedsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListGraspSets(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListGraspSets(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List grasp sets in a body.
 
         Args:
@@ -1619,6 +1697,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListGraspSetsReturnValue: 
@@ -1630,16 +1709,17 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListGraspSets', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGraspSetsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListGraspSets', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGraspSetsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListGripperBridgeModules(self, options=None, fields=None, timeout=None):
+    def ListGripperBridgeModules(self, options=None, fields=None, timeout=None, cache=False):
         """List gripper bridge modules.
 
         Args:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListGripperBridgeModulesReturnValue: 
@@ -1647,10 +1727,10 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListGripperBridgeModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGripperBridgeModulesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListGripperBridgeModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGripperBridgeModulesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListGripperInfos(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListGripperInfos(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List gripper infos defined on a robot.
 
         Args:
@@ -1661,6 +1741,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListGripperInfosReturnValue: 
@@ -1672,16 +1753,17 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListGripperInfos', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGripperInfosReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListGripperInfos', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGripperInfosReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListGroups(self, options=None, fields=None, timeout=None):
+    def ListGroups(self, options=None, fields=None, timeout=None, cache=False):
         """List user groups.
 
         Args:
             options (ListOptionsWithAggregationsInput, optional): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListGroupsReturnValue: 
@@ -1689,10 +1771,10 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsWithAggregationsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListGroups', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGroupsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListGroups', parameterNameTypeValues=parameterNameTypeValues, returnType='ListGroupsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListIKParameterizations(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListIKParameterizations(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List ikparams in a body.
 
         Args:
@@ -1703,6 +1785,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListIKParameterizationsReturnValue: 
@@ -1714,10 +1797,10 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListIKParameterizations', parameterNameTypeValues=parameterNameTypeValues, returnType='ListIKParameterizationsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListIKParameterizations', parameterNameTypeValues=parameterNameTypeValues, returnType='ListIKParameterizationsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListJoints(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListJoints(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List joints in a body.
 
         Args:
@@ -1728,6 +1811,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListJointsReturnValue: 
@@ -1739,10 +1823,10 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListJoints', parameterNameTypeValues=parameterNameTypeValues, returnType='ListJointsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListJoints', parameterNameTypeValues=parameterNameTypeValues, returnType='ListJointsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListLinks(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListLinks(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List links in a body.
 
         Args:
@@ -1753,6 +1837,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListLinksReturnValue: 
@@ -1764,10 +1849,10 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListLinks', parameterNameTypeValues=parameterNameTypeValues, returnType='ListLinksReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListLinks', parameterNameTypeValues=parameterNameTypeValues, returnType='ListLinksReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListLogEntries(self, logTypes=None, options=None, fields=None, timeout=None):
+    def ListLogEntries(self, logTypes=None, options=None, fields=None, timeout=None, cache=False):
         """List available log entries.
 
         Args:
@@ -1775,6 +1860,7 @@ class GraphQueries:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListLogEntriesReturnValue: 
@@ -1783,10 +1869,10 @@ class GraphQueries:
             ('logTypes', '[String!]', logTypes),
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListLogEntriesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListLogEntriesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListLogEntriesEx(self, logTypes=None, options=None, fields=None, timeout=None):
+    def ListLogEntriesEx(self, logTypes=None, options=None, fields=None, timeout=None, cache=False):
         """List available log entries with new aggregation options.
 
         Args:
@@ -1794,6 +1880,7 @@ class GraphQueries:
             options (ListOptionsWithAggregationsInput, optional): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListLogEntriesExReturnValue: 
@@ -1802,10 +1889,10 @@ class GraphQueries:
             ('logTypes', '[LogType!]', logTypes),
             ('options', 'ListOptionsWithAggregationsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListLogEntriesEx', parameterNameTypeValues=parameterNameTypeValues, returnType='ListLogEntriesExReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListLogEntriesEx', parameterNameTypeValues=parameterNameTypeValues, returnType='ListLogEntriesExReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListLogEntriesV2(self, logTypes=None, options=None, fields=None, timeout=None):
+    def ListLogEntriesV2(self, logTypes=None, options=None, fields=None, timeout=None, cache=False):
         """List available log entries with new aggregation options.
 
 
@@ -1814,6 +1901,7 @@ class GraphQueries:
             options (ListOptionsWithAggregationsInput, optional): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListLogEntriesV2ReturnValue: 
@@ -1822,10 +1910,10 @@ class GraphQueries:
             ('logTypes', '[LogType!]', logTypes),
             ('options', 'ListOptionsWithAggregationsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListLogEntriesV2', parameterNameTypeValues=parameterNameTypeValues, returnType='ListLogEntriesV2ReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListLogEntriesV2', parameterNameTypeValues=parameterNameTypeValues, returnType='ListLogEntriesV2ReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListModules(self, moduleTypes=None, options=None, fields=None, timeout=None):
+    def ListModules(self, moduleTypes=None, options=None, fields=None, timeout=None, cache=False):
         """List available modules.
 
         Args:
@@ -1833,6 +1921,7 @@ class GraphQueries:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListModulesReturnValue: 
@@ -1841,10 +1930,10 @@ class GraphQueries:
             ('moduleTypes', '[String!]', moduleTypes),
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListModulesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListModulesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListNonReferencedLogEntries(self, logTypes=None, options=None, fields=None, timeout=None):
+    def ListNonReferencedLogEntries(self, logTypes=None, options=None, fields=None, timeout=None, cache=False):
         """List log entries that are not referenced by any other log entry.
 
         Args:
@@ -1852,6 +1941,7 @@ class GraphQueries:
             options (ListOptionsWithAggregationsInput, optional): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListNonReferencedLogEntriesReturnValue: 
@@ -1860,10 +1950,10 @@ class GraphQueries:
             ('logTypes', '[LogType!]', logTypes),
             ('options', 'ListOptionsWithAggregationsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListNonReferencedLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListNonReferencedLogEntriesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListNonReferencedLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListNonReferencedLogEntriesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListNonReferencingLogEntries(self, logTypes=None, options=None, fields=None, timeout=None):
+    def ListNonReferencingLogEntries(self, logTypes=None, options=None, fields=None, timeout=None, cache=False):
         """List log entries that are not referencing any other log entry.
 
         Args:
@@ -1871,6 +1961,7 @@ class GraphQueries:
             options (ListOptionsWithAggregationsInput, optional): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListNonReferencingLogEntriesReturnValue: 
@@ -1879,16 +1970,17 @@ class GraphQueries:
             ('logTypes', '[LogType!]', logTypes),
             ('options', 'ListOptionsWithAggregationsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListNonReferencingLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListNonReferencingLogEntriesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListNonReferencingLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListNonReferencingLogEntriesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListOrchestratorModules(self, options=None, fields=None, timeout=None):
+    def ListOrchestratorModules(self, options=None, fields=None, timeout=None, cache=False):
         """List orchestrator modules.
 
         Args:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListOrchestratorModulesReturnValue: 
@@ -1896,10 +1988,10 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListOrchestratorModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListOrchestratorModulesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListOrchestratorModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListOrchestratorModulesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListPositionConfigurations(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListPositionConfigurations(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List position configurations in a body.
 
         Args:
@@ -1910,6 +2002,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListPositionConfigurationsReturnValue: 
@@ -1921,16 +2014,17 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListPositionConfigurations', parameterNameTypeValues=parameterNameTypeValues, returnType='ListPositionConfigurationsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListPositionConfigurations', parameterNameTypeValues=parameterNameTypeValues, returnType='ListPositionConfigurationsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListPrograms(self, options=None, fields=None, timeout=None):
+    def ListPrograms(self, options=None, fields=None, timeout=None, cache=False):
         """List all programs.
 
         Args:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListProgramsReturnValue: 
@@ -1938,16 +2032,17 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListPrograms', parameterNameTypeValues=parameterNameTypeValues, returnType='ListProgramsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListPrograms', parameterNameTypeValues=parameterNameTypeValues, returnType='ListProgramsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListProviderBridgeModules(self, options=None, fields=None, timeout=None):
+    def ListProviderBridgeModules(self, options=None, fields=None, timeout=None, cache=False):
         """List provider bridge modules.
 
         Args:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListProviderBridgeModulesReturnValue: 
@@ -1955,10 +2050,10 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListProviderBridgeModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListProviderBridgeModulesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListProviderBridgeModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListProviderBridgeModulesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListReferencedLogEntries(self, logEntryId, logTypes=None, options=None, fields=None, timeout=None):
+    def ListReferencedLogEntries(self, logEntryId, logTypes=None, options=None, fields=None, timeout=None, cache=False):
         """List particular log entries and their parents.
 
         Args:
@@ -1967,6 +2062,7 @@ class GraphQueries:
             options (ListOptionsWithAggregationsInput, optional): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListReferencedLogEntriesReturnValue: 
@@ -1976,10 +2072,10 @@ class GraphQueries:
             ('logTypes', '[LogType!]', logTypes),
             ('options', 'ListOptionsWithAggregationsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListReferencedLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListReferencedLogEntriesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListReferencedLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListReferencedLogEntriesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListReferencingLogEntries(self, logEntryId, logTypes=None, options=None, fields=None, timeout=None):
+    def ListReferencingLogEntries(self, logEntryId, logTypes=None, options=None, fields=None, timeout=None, cache=False):
         """List particular log entries and their children.
 
         Args:
@@ -1988,6 +2084,7 @@ class GraphQueries:
             options (ListOptionsWithAggregationsInput, optional): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListReferencingLogEntriesReturnValue: 
@@ -1997,10 +2094,10 @@ class GraphQueries:
             ('logTypes', '[LogType!]', logTypes),
             ('options', 'ListOptionsWithAggregationsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListReferencingLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListReferencingLogEntriesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListReferencingLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListReferencingLogEntriesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListRevisions(self, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListRevisions(self, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List revisions of an environment.
 
         Args:
@@ -2010,6 +2107,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListRevisionsReturnValue: 
@@ -2020,16 +2118,17 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListRevisions', parameterNameTypeValues=parameterNameTypeValues, returnType='ListRevisionsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListRevisions', parameterNameTypeValues=parameterNameTypeValues, returnType='ListRevisionsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListRobotBridgeModules(self, options=None, fields=None, timeout=None):
+    def ListRobotBridgeModules(self, options=None, fields=None, timeout=None, cache=False):
         """List robot bridge modules.
 
         Args:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListRobotBridgeModulesReturnValue: 
@@ -2037,16 +2136,17 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListRobotBridgeModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListRobotBridgeModulesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListRobotBridgeModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListRobotBridgeModulesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListRoles(self, options=None, fields=None, timeout=None):
+    def ListRoles(self, options=None, fields=None, timeout=None, cache=False):
         """List group roles.
 
         Args:
             options (ListOptionsWithAggregationsInput, optional): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListRolesReturnValue: 
@@ -2054,16 +2154,17 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsWithAggregationsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListRoles', parameterNameTypeValues=parameterNameTypeValues, returnType='ListRolesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListRoles', parameterNameTypeValues=parameterNameTypeValues, returnType='ListRolesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListSensorBridgeModules(self, options=None, fields=None, timeout=None):
+    def ListSensorBridgeModules(self, options=None, fields=None, timeout=None, cache=False):
         """List sensor bridge modules.
 
         Args:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListSensorBridgeModulesReturnValue: 
@@ -2071,10 +2172,10 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListSensorBridgeModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListSensorBridgeModulesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListSensorBridgeModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListSensorBridgeModulesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListStatEntries(self, endedAt=None, intervalType=None, options=None, startedAt=None, statTypes=None, fields=None, timeout=None):
+    def ListStatEntries(self, endedAt=None, intervalType=None, options=None, startedAt=None, statTypes=None, fields=None, timeout=None, cache=False):
         """Lists all or specific types of statistics entries for a given time interval.
 
 
@@ -2112,6 +2213,7 @@ class GraphQueries:
                     - recoveryAction
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListStatEntriesReturnValue: 
@@ -2123,10 +2225,10 @@ class GraphQueries:
             ('startedAt', 'DateTime', startedAt),
             ('statTypes', '[String!]', statTypes),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListStatEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListStatEntriesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListStatEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListStatEntriesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListStatEntriesEx(self, endedAt=None, intervalType=None, options=None, startedAt=None, statTypes=None, fields=None, timeout=None):
+    def ListStatEntriesEx(self, endedAt=None, intervalType=None, options=None, startedAt=None, statTypes=None, fields=None, timeout=None, cache=False):
         """Lists all or specific types of statistics entries for a given time interval, with the new aggregation option.
 
         Args:
@@ -2137,6 +2239,7 @@ class GraphQueries:
             statTypes ([StatType], optional): The type of statistics entries to list, defaults to list all.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListStatEntriesExReturnValue: 
@@ -2148,10 +2251,10 @@ class GraphQueries:
             ('startedAt', 'DateTime', startedAt),
             ('statTypes', '[StatType!]', statTypes),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListStatEntriesEx', parameterNameTypeValues=parameterNameTypeValues, returnType='ListStatEntriesExReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListStatEntriesEx', parameterNameTypeValues=parameterNameTypeValues, returnType='ListStatEntriesExReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListTools(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None):
+    def ListTools(self, bodyId, environmentId, options=None, resolveReferences=None, units=None, fields=None, timeout=None, cache=False):
         """List tools defined on a robot.
 
         Args:
@@ -2162,6 +2265,7 @@ class GraphQueries:
             units (UnitSelectionInput, optional): Optional unit selection.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListToolsReturnValue: 
@@ -2173,10 +2277,10 @@ class GraphQueries:
             ('resolveReferences', 'Boolean', resolveReferences),
             ('units', 'UnitSelectionInput', units),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListTools', parameterNameTypeValues=parameterNameTypeValues, returnType='ListToolsReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListTools', parameterNameTypeValues=parameterNameTypeValues, returnType='ListToolsReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListUntypedLogEntries(self, logTypes=None, options=None, fields=None, timeout=None):
+    def ListUntypedLogEntries(self, logTypes=None, options=None, fields=None, timeout=None, cache=False):
         """List available log entries without typing.
 
         Args:
@@ -2184,6 +2288,7 @@ class GraphQueries:
             options (ListOptionsWithAggregationsInput, optional): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListUntypedLogEntriesReturnValue: 
@@ -2192,16 +2297,17 @@ class GraphQueries:
             ('logTypes', '[LogType!]', logTypes),
             ('options', 'ListOptionsWithAggregationsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListUntypedLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListUntypedLogEntriesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListUntypedLogEntries', parameterNameTypeValues=parameterNameTypeValues, returnType='ListUntypedLogEntriesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListUsers(self, options=None, fields=None, timeout=None):
+    def ListUsers(self, options=None, fields=None, timeout=None, cache=False):
         """List users of the system.
 
         Args:
             options (ListOptionsWithAggregationsInput, optional): 
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListUsersReturnValue: 
@@ -2209,16 +2315,17 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsWithAggregationsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListUsers', parameterNameTypeValues=parameterNameTypeValues, returnType='ListUsersReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListUsers', parameterNameTypeValues=parameterNameTypeValues, returnType='ListUsersReturnValue', fields=fields, timeout=timeout, cache=cache)
 
     @UseLazyGraphQuery
-    def ListVisionTaskModules(self, options=None, fields=None, timeout=None):
+    def ListVisionTaskModules(self, options=None, fields=None, timeout=None, cache=False):
         """List vision task modules.
 
         Args:
             options (ListOptionsInput, optional): Optional list query parameters, used to filter returned results.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             ListVisionTaskModulesReturnValue: 
@@ -2226,9 +2333,9 @@ class GraphQueries:
         parameterNameTypeValues = [
             ('options', 'ListOptionsInput', options),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='ListVisionTaskModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListVisionTaskModulesReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='ListVisionTaskModules', parameterNameTypeValues=parameterNameTypeValues, returnType='ListVisionTaskModulesReturnValue', fields=fields, timeout=timeout, cache=cache)
 
-    def Ping(self, host, size=None, ttl=None, fields=None, timeout=None):
+    def Ping(self, host, size=None, ttl=None, fields=None, timeout=None, cache=False):
         """Ping a remote host.
 
         Args:
@@ -2237,6 +2344,7 @@ class GraphQueries:
             ttl (int, optional): time to live of the package
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             PingReturnValue: 
@@ -2246,23 +2354,24 @@ class GraphQueries:
             ('size', 'Int', size),
             ('ttl', 'Int', ttl),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='Ping', parameterNameTypeValues=parameterNameTypeValues, returnType='PingReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='Ping', parameterNameTypeValues=parameterNameTypeValues, returnType='PingReturnValue', fields=fields, timeout=timeout, cache=cache)
 
-    def QueryAvailableUpgrades(self, fields=None, timeout=None):
+    def QueryAvailableUpgrades(self, fields=None, timeout=None, cache=False):
         """Query available upgrade images for this controller.
 
         Args:
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             [HypervisorAvailableUpgrade]: 
         """
         parameterNameTypeValues = [
         ]
-        return self._CallSimpleGraphAPI('query', operationName='QueryAvailableUpgrades', parameterNameTypeValues=parameterNameTypeValues, returnType='HypervisorAvailableUpgrade', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='QueryAvailableUpgrades', parameterNameTypeValues=parameterNameTypeValues, returnType='HypervisorAvailableUpgrade', fields=fields, timeout=timeout, cache=cache)
 
-    def Telnet(self, host, port, data=None, fields=None, timeout=None):
+    def Telnet(self, host, port, data=None, fields=None, timeout=None, cache=False):
         """Telnet to a remote host using TCP.
 
         Args:
@@ -2271,6 +2380,7 @@ class GraphQueries:
             data (Data, optional): bytes in base64 to be sent upon connection
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             TelnetReturnValue: 
@@ -2280,9 +2390,9 @@ class GraphQueries:
             ('port', 'Int!', port),
             ('data', 'Data', data),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='Telnet', parameterNameTypeValues=parameterNameTypeValues, returnType='TelnetReturnValue', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='Telnet', parameterNameTypeValues=parameterNameTypeValues, returnType='TelnetReturnValue', fields=fields, timeout=timeout, cache=cache)
 
-    def TraverseProgramCommits(self, commitId, limit, fields=None, timeout=None):
+    def TraverseProgramCommits(self, commitId, limit, fields=None, timeout=None, cache=False):
         """Traverse program commit objects starting from the given commit.
 
         Args:
@@ -2290,6 +2400,7 @@ class GraphQueries:
             limit (int): Depth limit of the traversal.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             [ProgramObject]: A blob, tree or commit object. Can be shared by multiple programs
@@ -2298,9 +2409,9 @@ class GraphQueries:
             ('commitId', 'String!', commitId),
             ('limit', 'Int!', limit),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='TraverseProgramCommits', parameterNameTypeValues=parameterNameTypeValues, returnType='ProgramObject', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='TraverseProgramCommits', parameterNameTypeValues=parameterNameTypeValues, returnType='ProgramObject', fields=fields, timeout=timeout, cache=cache)
 
-    def TraverseProgramTrees(self, limit, objectId, fields=None, timeout=None):
+    def TraverseProgramTrees(self, limit, objectId, fields=None, timeout=None, cache=False):
         """Traverse program tree objects starting from the given commit or tree.
 
         Args:
@@ -2308,6 +2419,7 @@ class GraphQueries:
             objectId (str): ID of the program tree or commit object to be traversed.
             fields (list or dict, optional): Specifies a subset of fields to return.
             timeout (float, optional): Number of seconds to wait for response.
+            cache (bool, optional): Whether to reuse the result of an identical query made within the last minute.
 
         Returns:
             [ProgramObject]: A blob, tree or commit object. Can be shared by multiple programs
@@ -2316,7 +2428,7 @@ class GraphQueries:
             ('limit', 'Int!', limit),
             ('objectId', 'String!', objectId),
         ]
-        return self._CallSimpleGraphAPI('query', operationName='TraverseProgramTrees', parameterNameTypeValues=parameterNameTypeValues, returnType='ProgramObject', fields=fields, timeout=timeout)
+        return self._CallSimpleGraphAPI('query', operationName='TraverseProgramTrees', parameterNameTypeValues=parameterNameTypeValues, returnType='ProgramObject', fields=fields, timeout=timeout, cache=cache)
 
 
 class GraphMutations:
@@ -1,48 +1,176 @@
 # -*- coding: utf-8 -*-
 
 from functools import wraps
-import logging
 import copy
+import itertools
+import logging
+import sys
+import threading
+import six
+from . import _, json, GetMonotonicTime, WebstackClientError
 from . import webstackclientutils
 log = logging.getLogger(__name__)
 
+try:
+    from functools import lru_cache
+except ImportError:
+    # python2 does not have lru_cache, use a simple bounded cache instead
+    def lru_cache(maxsize=128):
+        def decorator(function):
+            cache = {}
+
+            @wraps(function)
+            def wrapper(*args):
+                try:
+                    return cache[args]
+                except KeyError:
+                    pass
+                result = function(*args)
+                if len(cache) >= maxsize:
+                    cache.clear()
+                cache[args] = result
+                return result
+            return wrapper
+        return decorator
+
+_SCALAR_TYPES = frozenset((
+    # the followings are part of graphql spec
+    'Int',
+    'Float',
+    'String',
+    'Boolean',
+    'ID',
+    # the followings are mujin customized
+    'Data',
+    'Any',
+    'Void',
+    'DateTime',
+))
+
+_TYPENAME_QUERY_FIELDS = ' { __typename }' # query fields used when caller didn't select any field
+
 def _IsScalarType(typeName):
-    return typeName in (
-        # the followings are part of graphql spec
-        'Int',
-        'Float',
-        'String',
-        'Boolean',
-        'ID',
-        # the followings are mujin customized
-        'Data',
-        'Any',
-        'Void',
-        'DateTime',
-    )
+    return typeName in _SCALAR_TYPES
 
-def _StringifyQueryFields(fields):
-    selectedFields = []
+def _FreezeQueryFields(fields):
+    """Converts the fields selected by the caller into a hashable tuple, preserving the order of the fields.
+    A field without subfields is represented by its name, a field with subfields by a tuple (fieldName, frozenSubFields).
+    """
     if isinstance(fields, dict):
-        for fieldName, subFields in fields.items():
-            if subFields:
-                subQuery = _StringifyQueryFields(subFields)
-                selectedFields.append('%s %s' % (fieldName, subQuery))
-            else:
-                selectedFields.append(fieldName)
+        return tuple([
+            (fieldName, _FreezeQueryFields(subFields)) if subFields else fieldName
+            for fieldName, subFields in fields.items()
+        ])
+    return tuple(fields)
+
+@lru_cache(maxsize=1024)
+def _StringifyFrozenQueryFields(frozenFields):
+    selectedFields = [
+        field[0] + ' ' + _StringifyFrozenQueryFields(field[1]) if isinstance(field, tuple) else field
+        for field in frozenFields
+    ]
+    return '{' + ', '.join(selectedFields) + '}'
+
+def _StringifyQueryFields(fields):
+    return _StringifyFrozenQueryFields(_FreezeQueryFields(fields))
+
+def PrepareFields(fields):
+    """Converts the fields to the string used in graph queries. The returned string can be passed as fields to graph api calls and GraphQueryIterator,
+    so callers repeatedly using the same fields can skip converting them on every call.
+
+    Functions decorated with UseLazyGraphQuery do not accept prepared fields, since they need to add meta to the fields;
+    use GraphQueryIterator to iterate through all items with prepared fields.
+
+    Args:
+        fields (list or dict): fields to filter for
+
+    Returns:
+        string: the fields in graph query syntax, e.g. '{environments {id}}'
+    """
+    if isinstance(fields, six.string_types):
+        return fields
+    return _StringifyQueryFields(fields)
+
+@lru_cache(maxsize=256)
+def _BuildQuery(queryOrMutation, operationName, parameterNameTypes, returnType, frozenFields):
+    """Builds the graph query string. The query only depends on the parameter names and types, the values are passed separately as variables.
+
+    Args:
+        queryOrMutation (string): either "query" or "mutation"
+        operationName (string): name of the operation
+        parameterNameTypes (tuple): tuple of tuple (parameterName, parameterType)
+        returnType (string): name of the return type, used to construct query fields
+        frozenFields (tuple or string): fields to filter for, as returned by _FreezeQueryFields or PrepareFields
+    """
+    # query fields include the leading space separating them from the operation
+    if _IsScalarType(returnType):
+        queryFields = '' # scalar types cannot have subfield queries
+    elif not frozenFields:
+        queryFields = _TYPENAME_QUERY_FIELDS # query the __typename field if caller didn't want anything back
+    elif isinstance(frozenFields, six.string_types):
+        queryFields = ' ' + frozenFields # already prepared by caller
     else:
-        for fieldName in fields:
-            selectedFields.append(fieldName)
-    return '{%s}' % ', '.join(selectedFields)
+        queryFields = ' ' + _StringifyFrozenQueryFields(frozenFields)
+    queryParameters = []
+    queryArguments = []
+    for parameterName, parameterType in parameterNameTypes:
+        queryParameters.append('$' + parameterName + ': ' + parameterType)
+        queryArguments.append(parameterName + ': $' + parameterName)
+    queryParameters = '(' + ', '.join(queryParameters) + ')' if queryParameters else ''
+    queryArguments = '(' + ', '.join(queryArguments) + ')' if queryArguments else ''
+    return queryOrMutation + ' ' + operationName + queryParameters + ' {\n    ' + operationName + queryArguments + queryFields + '\n}'
+
+def _TruncatedRepr(value, maxLength=2048):
+    """Returns repr of the value truncated to maxLength characters, used to keep verbose logs of large payloads readable
+    """
+    text = repr(value)
+    if len(text) > maxLength:
+        return text[:maxLength] + '...'
+    return text
+
+class _BackgroundCall(object):
+    """Runs a function in a background thread, the result is retrieved with GetResult
+    """
+    _thread = None # the thread running the function
+    _result = None # the return value of the function
+    _excInfo = None # the exception info if the function raised
+
+    def __init__(self, function, *args, **kwargs):
+        self._thread = threading.Thread(target=self._Run, args=(function, args, kwargs))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _Run(self, function, args, kwargs):
+        try:
+            self._result = function(*args, **kwargs)
+        except Exception:
+            self._excInfo = sys.exc_info()
+
+    def Wait(self):
+        """Wait for the function to finish, ignoring its result
+        """
+        self._thread.join()
+
+    def GetResult(self):
+        """Wait for the function to finish and return its result, re-raising any exception it raised
+        """
+        self._thread.join()
+        if self._excInfo is not None:
+            six.reraise(*self._excInfo)
+        return self._result
 
 class GraphClientBase(object):
 
     _webclient = None # an instance of ControllerWebClientRaw
+    _queryCache = None # dict mapping (query, serialized variables) to tuple (expiration time, data) for queries called with cache=True
+    _queryCacheMaxSize = 128 # the maximum number of cached query results
+    _queryCacheTimeout = 60.0 # the number of seconds a cached query result is reused
 
     def __init__(self, webclient):
         self._webclient = webclient
+        self._queryCache = {}
 
-    def _CallSimpleGraphAPI(self, queryOrMutation, operationName, parameterNameTypeValues, returnType, fields=None, timeout=None):
+    def _CallSimpleGraphAPI(self, queryOrMutation, operationName, parameterNameTypeValues, returnType, fields=None, timeout=None, cache=False):
         """
 
         Args:
@@ -50,48 +178,101 @@ class GraphClientBase(object):
             operationName (string): name of the operation
             parameterNameTypeValues (list): list of tuple (parameterName, parameterType, parameterValue)
             returnType (string): name of the return type, used to construct query fields
-            fields (list[string]): list of fieldName to filter for
+            fields (list[string]): list of fieldName to filter for, or the string returned by PrepareFields
             timeout (float): timeout in seconds
+            cache (bool): whether to reuse the result of an identical query made within the last _queryCacheTimeout seconds, ignored for mutations
         """
         if timeout is None:
             timeout = 5.0
-        queryFields = ''
-        if _IsScalarType(returnType):
-            queryFields = '' # scalar types cannot have subfield queries
-        elif not fields:
-            queryFields = '{ __typename }' # query the __typename field if caller didn't want anything back
-        else:
-            queryFields = _StringifyQueryFields(fields)
-        queryParameters = ', '.join([
-            '$%s: %s' % (parameterName, parameterType)
-            for parameterName, parameterType, parameterValue in parameterNameTypeValues
-        ])
-        if queryParameters:
-            queryParameters = '(%s)' % queryParameters
-        queryArguments = ', '.join([
-            '%s: $%s' % (parameterName, parameterName)
-            for parameterName, parameterType, parameterValue in parameterNameTypeValues
-        ])
-        if queryArguments:
-            if queryFields:
-                queryFields = ' %s' % queryFields
-            queryArguments = '(%s)' % queryArguments
-        query = '%(queryOrMutation)s %(operationName)s%(queryParameters)s {\n    %(operationName)s%(queryArguments)s%(queryFields)s\n}' % {
-            'queryOrMutation': queryOrMutation,
-            'operationName': operationName,
-            'queryParameters': queryParameters,
-            'queryArguments': queryArguments,
-            'queryFields': queryFields,
-        }
+        query, variables = self._PrepareQuery(queryOrMutation, operationName, parameterNameTypeValues, returnType, fields)
+        isVerbose = log.isEnabledFor(5) # logging.VERBOSE might not be available in the system
+        cacheKey = None
+        if queryOrMutation != 'query':
+            # mutation might change the cached results
+            self._queryCache.clear()
+        elif cache:
+            cacheKey = (query, json.dumps(variables, sort_keys=True))
+            data = self._GetCachedQueryResult(cacheKey)
+            if data is not None:
+                if isVerbose:
+                    log.verbose('using cached response for graph query with variables %s:\n\n%s\n', _TruncatedRepr(variables), query)
+                return data.get(operationName)
+        if isVerbose:
+            log.verbose('executing graph query with variables %s:\n\n%s\n', _TruncatedRepr(variables), query)
+        data = self._webclient.CallGraphAPI(query, variables, timeout=timeout)
+        if isVerbose:
+            log.verbose('got response from graph query: %s', _TruncatedRepr(data))
+        if cacheKey is not None:
+            self._SetCachedQueryResult(cacheKey, data)
+        return data.get(operationName)
+
+    def _GetCachedQueryResult(self, cacheKey):
+        """Returns a copy of the cached query result, or None if not cached or expired
+        """
+        cached = self._queryCache.get(cacheKey)
+        if cached is None:
+            return None
+        expirationTime, data = cached
+        if GetMonotonicTime() >= expirationTime:
+            self._queryCache.pop(cacheKey, None)
+            return None
+        # return a copy so that caller cannot modify the cached result
+        return copy.deepcopy(data)
+
+    def _SetCachedQueryResult(self, cacheKey, data):
+        """Caches a copy of the query result for _queryCacheTimeout seconds
+        """
+        now = GetMonotonicTime()
+        if len(self._queryCache) >= self._queryCacheMaxSize:
+            # drop expired results first, then the oldest ones
+            for key, (expirationTime, cachedData) in list(self._queryCache.items()):
+                if now >= expirationTime:
+                    self._queryCache.pop(key, None)
+            while len(self._queryCache) >= self._queryCacheMaxSize:
+                self._queryCache.pop(min(self._queryCache, key=lambda key: self._queryCache[key][0]), None)
+        self._queryCache[cacheKey] = (now + self._queryCacheTimeout, copy.deepcopy(data))
+
+    def _CallBatchedGraphAPI(self, specs, timeout=None):
+        """Sends multiple graph queries or mutations in a single request, requires webstack to support batching.
+
+        Args:
+            specs (list): list of tuple (queryOrMutation, operationName, parameterNameTypeValues, returnType, fields), same as the arguments of _CallSimpleGraphAPI
+            timeout (float): timeout in seconds
+
+        Returns:
+            list: result of each operation, in the same order as specs
+        """
+        if timeout is None:
+            timeout = 5.0
+        queries = []
+        for queryOrMutation, operationName, parameterNameTypeValues, returnType, fields in specs:
+            if queryOrMutation != 'query':
+                # mutation might change the cached results
+                self._queryCache.clear()
+            query, variables = self._PrepareQuery(queryOrMutation, operationName, parameterNameTypeValues, returnType, fields)
+            queries.append((query, variables, operationName))
+        isVerbose = log.isEnabledFor(5) # logging.VERBOSE might not be available in the system
+        if isVerbose:
+            log.verbose('executing %d batched graph queries:\n\n%s\n', len(queries), '\n\n'.join(['%s\nwith variables %s' % (query, _TruncatedRepr(variables)) for query, variables, operationName in queries]))
+        results = self._webclient.CallBatchedGraphAPI(queries, timeout=timeout)
+        if isVerbose:
+            log.verbose('got response from batched graph queries: %s', _TruncatedRepr(results))
+        return [data.get(operationName) for data, (query, variables, operationName) in zip(results, queries)]
+
+    def _PrepareQuery(self, queryOrMutation, operationName, parameterNameTypeValues, returnType, fields):
+        """Returns a tuple of the query string and the variables dict
+        """
+        parameterNameTypes = []
         variables = {}
         for parameterName, parameterType, parameterValue in parameterNameTypeValues:
+            parameterNameTypes.append((parameterName, parameterType))
             variables[parameterName] = parameterValue
-        if log.isEnabledFor(5): # logging.VERBOSE might not be available in the system
-            log.verbose('executing graph query with variables %r:\n\n%s\n', variables, query)
-        data = self._webclient.CallGraphAPI(query, variables, timeout=timeout)
-        if log.isEnabledFor(5): # logging.VERBOSE might not be available in the system
-            log.verbose('got response from graph query: %r', data)
-        return data.get(operationName)
+        if not fields:
+            fields = ()
+        elif not isinstance(fields, six.string_types):
+            fields = _FreezeQueryFields(fields)
+        query = _BuildQuery(queryOrMutation, operationName, tuple(parameterNameTypes), returnType, fields)
+        return query, variables
 
 class GraphQueryIterator:
     """Converts a large graph query to a iterator. The iterator will internally query webstack with a few small queries
@@ -103,19 +284,53 @@ class GraphQueryIterator:
           do_something(body['id'])
       for environment in GraphQueryIterator(client.graphApi.ListEnvironments, fields={'environments': {'id': None}}):
           do_something(environment['id'])
+
+    Pass prefetch=True to query the next page in a background thread while the items of the current page are consumed.
+    The background query shares the http session of the client, which is not thread-safe, so the same client must not be used
+    to make other calls while iterating with prefetch. Errors raised by the background query are raised when the page is needed.
+    Call close() when stopping the iteration early, it waits for the background query to finish:
+
+      iterator = GraphQueryIterator(client.graphApi.ListEnvironments, fields={'environments': {'id': None}}, prefetch=True)
+      for environment in iterator:
+          if do_something(environment['id']):
+              break
+      iterator.close()
+
+    Pass cursorField to page with cursors instead of offsets when the query supports it (e.g. Relay-style 'after' option and 'pageInfo' field).
+    pageInfo.endCursor is selected automatically when fields is a dict, and sent back as options[cursorField] for the following pages:
+
+      for environment in GraphQueryIterator(client.graphApi.ListEnvironments, fields={'environments': {'id': None}}, cursorField='after'):
+          do_something(environment['id'])
+
+    Fields are converted to string once when the iterator is created. Callers creating many iterators with the same fields can convert them once with PrepareFields:
+
+      fields = PrepareFields({'bodies': {'id': None}})
+      for environmentId in environmentIds:
+          for body in GraphQueryIterator(client.graphApi.ListBodies, environmentId, fields=fields):
+              do_something(body['id'])
     """
 
     _queryFunction = None # the actual webstack client query function (e.g. client.graphApi.ListEnvironments) 
     _queryArgs = None # positional arguments supplied to the query function (e.g. environmentId)
     _queryKwargs = None # keyword arguments supplied to the query function (e.g. options={'first': 10, 'offset': 5}, fields={'environments': {'id': None}})
-    _items = [] # internal buffer for items retrieved from webstack
+    _items = () # items already retrieved from webstack before the iteration starts
     _shouldStop = False # boolean flag indicates whether need to query webstack again
     _initialLimit = None # the number of items user requests (0 means no limit)
-    _count = 0 # the number of items already returned to user
+    _count = 0 # the number of items already retrieved from webstack for the user
+    _offset = 0 # the offset of the next item to query, also counted when paging with cursor so that paging can fall back to offset
+    _prefetch = False # whether to query the next page in background while items in buffer are consumed
+    _cursorField = None # name of the option used to pass the cursor of the next page (e.g. 'after'), None to page with offset
+    _cursor = None # the cursor of the next page, None to page with offset
+    _keyName = None # the name of actual data in the dictionary retrieved from webstack (e.g. 'bodies', 'environments', 'geometries')
+    _totalCount = None # the number of available items in webstack, only known if meta.totalCount is selected in fields
+    _generator = None # the generator producing the items
 
     def __init__(self, queryFunction, *args, **kwargs):
         """Initialize all internal variables
         """
+        self._prefetch = kwargs.pop('prefetch', False)
+        self._cursorField = kwargs.pop('cursorField', None)
+
         # retrieve the actual query function instead of the wrapper function generated by UseLazyGraphQuery decorator
         if hasattr(queryFunction, "inner"):
             args = (queryFunction.__self__,) + args
@@ -124,18 +339,33 @@ class GraphQueryIterator:
         # save the query function and all parameters
         self._queryFunction = queryFunction
         self._queryArgs = args
-        self._queryKwargs = copy.deepcopy(kwargs)
+        # only options is modified, so shallow copy it instead of deep copying all the parameters
+        self._queryKwargs = dict(kwargs)
+        self._queryKwargs['options'] = dict(self._queryKwargs.get('options') or {})
 
         # initialize limit and offset
-        if self._queryKwargs.get('options') is None:
-            self._queryKwargs['options'] = {'offset': 0, 'first': 0}
         self._queryKwargs['options'].setdefault('offset', 0)
         self._queryKwargs['options'].setdefault('first', 0)
         self._initialLimit = self._queryKwargs['options']['first']
+        self._offset = self._queryKwargs['options']['offset']
+        if self._cursorField is not None:
+            self._cursor = self._queryKwargs['options'].get(self._cursorField)
 
         # update the current limit
         self._queryKwargs['options']['first'] = webstackclientutils.GetMaximumQueryLimit(self._initialLimit)
 
+        # select the cursor of the next page
+        if self._cursorField is not None and isinstance(self._queryKwargs.get('fields'), dict):
+            self._queryKwargs['fields'] = dict(self._queryKwargs['fields'])
+            self._queryKwargs['fields']['pageInfo'] = {'endCursor': None, 'hasNextPage': None}
+
+        # convert fields to string once instead of on every query
+        if self._queryKwargs.get('fields'):
+            self._queryKwargs['fields'] = PrepareFields(self._queryKwargs['fields'])
+
+        # the generator does not run until the first item is requested
+        self._generator = self._GenerateItems()
+
     def __iter__(self):
         return self
 
@@ -149,42 +379,144 @@ class GraphQueryIterator:
         """Retrieve the next item from iterator
             Required by Python2
         """
-        # return an item from internal buffer if buffer is not empty
-        if len(self._items) != 0:
-            item = self._items[0]
-            self._items = self._items[1:]
-            self._count += 1
-            return item
-
-        # stop iteration if internal buffer is empty and no need to query webstack again
-        if self._shouldStop:
-            raise StopIteration
-
-        # query webstack if buffer is empty
-        rawResponse = self._queryFunction(*self._queryArgs, **self._queryKwargs)
-
-        # ignore meta and typename in top level
-        if 'meta' in rawResponse:
-            del rawResponse['meta']
-        if '__typename' in rawResponse:
-            del rawResponse['__typename']
-        
-        # process actual data
-        if not rawResponse:
-            # no actual items
-            raise StopIteration
-        self._items = list(rawResponse.values())[0]
-        self._queryKwargs['options']['offset'] += len(self._items)
-
-        if len(self._items) < self._queryKwargs['options']['first']:
-            # webstack does not have more items
-            self._shouldStop = True
-        if self._initialLimit != 0 and self._count + len(self._items) >= self._initialLimit:
-            # all remaining items user requests are in internal buffer, no need to query webstack again
-            self._shouldStop = True
-            self._items = self._items[:self._initialLimit - self._count]
-        
-        return self.next()
+        try:
+            return next(self._generator)
+        except StopIteration:
+            raise
+        except Exception:
+            # a failed generator cannot be resumed, recreate it from the state saved before the failed query so that caller can retry
+            self._generator = self._GenerateItems()
+            raise
+
+    def close(self):
+        """Stop the iteration, waiting for the background query to finish when prefetch is enabled
+        """
+        self._generator.close()
+
+    @property
+    def keyName(self):
+        """the name of actual data in the dictionary retrieved from webstack, available after the first item is retrieved
+           e.g. 'bodies', 'environments', 'geometries'
+        """
+        return self._keyName
+
+    @property
+    def totalCount(self):
+        """the number of available items in webstack, available after the first item is retrieved if meta.totalCount is selected in fields
+        """
+        return self._totalCount
+
+    def _PrefillBuffer(self, items, shouldStop=False):
+        """Fill the internal buffer with items already retrieved from webstack at the current offset, so that they are not queried again.
+        Must be called before the iteration starts.
+
+        Args:
+            items (list): items retrieved from webstack starting at the current offset
+            shouldStop (bool): whether items already contain every remaining item
+        """
+        self._offset += len(items)
+        if self._initialLimit != 0 and len(items) >= self._initialLimit:
+            # all items user requests are in internal buffer
+            shouldStop = True
+            items = itertools.islice(items, self._initialLimit)
+            self._count = self._initialLimit
+        else:
+            self._count = len(items)
+        self._shouldStop = shouldStop
+        self._items = items
+
+    def _GenerateItems(self):
+        """Yield the items in internal buffer, then query webstack page by page until there are no more items
+        """
+        # keep the iteration state in local variables
+        queryFunction = self._queryFunction
+        queryArgs = self._queryArgs
+        queryKwargs = self._queryKwargs
+        options = queryKwargs['options']
+        pageLimit = options['first']
+        initialLimit = self._initialLimit
+        prefetch = self._prefetch
+        cursorField = self._cursorField
+        items = self._items
+        count = self._count
+        offset = self._offset
+        cursor = self._cursor
+        shouldStop = self._shouldStop
+        pendingQuery = None # _BackgroundCall querying the next page when prefetch is enabled
+        self._items = ()
+
+        def _SetPagePosition(pageOptions):
+            # continue after the cursor if webstack returned one, otherwise from the offset
+            if cursor is not None:
+                pageOptions[cursorField] = cursor
+                pageOptions.pop('offset', None)
+            else:
+                pageOptions['offset'] = offset
+                if cursorField is not None:
+                    pageOptions.pop(cursorField, None)
+
+        try:
+            while True:
+                for item in items:
+                    yield item
+
+                # stop iteration if internal buffer is empty and no need to query webstack again
+                if shouldStop:
+                    return
+
+                # save the state in case the query fails and the iteration is retried
+                self._offset = offset
+                self._cursor = cursor
+                self._count = count
+                self._shouldStop = shouldStop
+
+                # query webstack if buffer is empty
+                if pendingQuery is not None:
+                    rawResponse = pendingQuery.GetResult()
+                    pendingQuery = None
+                else:
+                    _SetPagePosition(options)
+                    rawResponse = queryFunction(*queryArgs, **queryKwargs)
+
+                # ignore meta and typename in top level
+                meta = rawResponse.pop('meta', None)
+                if isinstance(meta, dict) and 'totalCount' in meta:
+                    self._totalCount = meta['totalCount']
+                rawResponse.pop('__typename', None)
+                pageInfo = rawResponse.pop('pageInfo', None) if cursorField is not None else None
+
+                # process actual data
+                if not rawResponse:
+                    # no actual items
+                    return
+                self._keyName, items = next(iter(rawResponse.items()))
+                offset += len(items)
+                if cursorField is not None:
+                    cursor = (pageInfo or {}).get('endCursor') or None
+                    if pageInfo and pageInfo.get('hasNextPage') is False:
+                        # webstack does not have more items
+                        shouldStop = True
+
+                if len(items) < pageLimit:
+                    # webstack does not have more items
+                    shouldStop = True
+                if initialLimit != 0 and count + len(items) >= initialLimit:
+                    # all remaining items user requests are in internal buffer, no need to query webstack again
+                    shouldStop = True
+                    items = itertools.islice(items, initialLimit - count)
+                else:
+                    count += len(items)
+
+                if prefetch and not shouldStop:
+                    # query the next page in background with its own copy of options
+                    prefetchKwargs = dict(queryKwargs)
+                    prefetchKwargs['options'] = dict(options)
+                    _SetPagePosition(prefetchKwargs['options'])
+                    pendingQuery = _BackgroundCall(queryFunction, *queryArgs, **prefetchKwargs)
+        finally:
+            # do not leave the background query using the http session after the iteration stops (e.g. close() is called)
+            if pendingQuery is not None:
+                pendingQuery.Wait()
 
 class LazyGraphQuery(webstackclientutils.LazyQuery):
     """Wraps graph query response. Break large query into small queries automatically to save memory.
@@ -199,11 +531,11 @@ class LazyGraphQuery(webstackclientutils.LazyQuery):
         # save the query function and all parameters
         self._queryFunction = queryFunction
         self._queryArgs = args
-        self._queryKwargs = copy.deepcopy(kwargs)
+        # only options is modified, so shallow copy it instead of deep copying all the parameters
+        self._queryKwargs = dict(kwargs)
+        self._queryKwargs['options'] = dict(self._queryKwargs.get('options') or {})
 
         # initialize limit and offset
-        if self._queryKwargs.get('options') is None:
-            self._queryKwargs['options'] = {'offset': 0, 'first': 0}
         self._queryKwargs['options'].setdefault('offset', 0)
         self._queryKwargs['options'].setdefault('first', 0)
         self._initialOffset = self._queryKwargs['options']['offset']
@@ -214,13 +546,14 @@ class LazyGraphQuery(webstackclientutils.LazyQuery):
             # if the user didn't select any field
             self._currentFields = {'__typename': None}
         else:
-            self._currentFields = self._queryKwargs['fields']
+            # shallow copy since meta is added below, caller's fields should not be modified
+            self._currentFields = dict(self._queryKwargs['fields'])
 
         # initialize meta and total count
         self._currentFields.setdefault('meta', {})
-        if type(self._currentFields['meta']) is dict:
-            # do not modify fields if caller provided incorrect meta fields
-            # e.g. client.graphApi.ListEnvironments(fields={'meta': None})
+        if self._currentFields['meta'] is None or type(self._currentFields['meta']) is dict:
+            # meta cannot be queried without subfields, e.g. client.graphApi.ListEnvironments(fields=['meta'])
+            self._currentFields['meta'] = dict(self._currentFields['meta'] or {})
             self._currentFields['meta'].setdefault('totalCount', None)
 
         # get the meta only with a minimal webstack call
@@ -234,12 +567,20 @@ class LazyGraphQuery(webstackclientutils.LazyQuery):
     def __iter__(self):
         if self._fetchedAll:
             return list.__iter__(self)
-        # return an iterator with the original offset and limit values
+        return self._CreateIterator()
+
+    def _CreateIterator(self):
+        """Create an iterator with the original offset and limit values, reusing the items already in buffer
+        """
         self._queryKwargs['fields'] = self._currentFields
         self._queryKwargs['options']['offset'] = self._initialOffset
         self._queryKwargs['options']['first'] = self._initialLimit
-        return GraphQueryIterator(self._queryFunction, *self._queryArgs, **self._queryKwargs)
-    
+        iterator = GraphQueryIterator(self._queryFunction, *self._queryArgs, **self._queryKwargs)
+        if self._items and self._currentOffset == self._initialOffset:
+            # buffer starts at the original offset, no need to query these items again
+            iterator._PrefillBuffer(self._items, shouldStop=len(self._items) >= len(self))
+        return iterator
+
     def _APICall(self):
         """Make one webstack query
         """
@@ -262,7 +603,7 @@ class LazyGraphQuery(webstackclientutils.LazyQuery):
         # process actual data
         if data:
             # for example `'environments': [...]`
-            self._keyName, self._items = list(data.items())[0]
+            self._keyName, self._items = next(iter(data.items()))
 
     @property
     def keyName(self):
@@ -283,11 +624,13 @@ class LazyGraphQuery(webstackclientutils.LazyQuery):
         """
         if self._fetchedAll:
             return
-        self._queryKwargs['fields'] = self._currentFields
-        self._queryKwargs['options']['offset'] = self._initialOffset
-        self._queryKwargs['options']['first'] = self._initialLimit
-        items = list(GraphQueryIterator(self._queryFunction, *self._queryArgs, **self._queryKwargs))
-        list.__init__(self, items)
+        iterator = self._CreateIterator()
+        list.__init__(self, iterator)
+        # keep the latest values seen while fetching
+        if iterator.keyName is not None:
+            self._keyName = iterator.keyName
+        if iterator.totalCount is not None:
+            self._totalCount = iterator.totalCount
         self._fetchedAll = True
     
 def UseLazyGraphQuery(queryFunction):
@@ -295,6 +638,9 @@ def UseLazyGraphQuery(queryFunction):
     """
     @wraps(queryFunction)
     def wrapper(self, *args, **kwargs):
+        if isinstance(kwargs.get('fields'), six.string_types):
+            # prepared fields cannot be extended with meta
+            raise WebstackClientError(_('Prepared fields are not supported by %s, use GraphQueryIterator instead') % queryFunction.__name__)
         if 'fields' in kwargs and not isinstance(kwargs['fields'], dict):
             kwargs['fields'] = {key: None for key in kwargs['fields']}
         queryResult = LazyGraphQuery(queryFunction, *((self,) + args), **kwargs)
@@ -303,7 +649,8 @@ def UseLazyGraphQuery(queryFunction):
             response['__typename'] = queryResult.typeName
         if queryResult.keyName is not None:
             response[queryResult.keyName] = queryResult
-        if 'totalCount' in kwargs.get('fields', {}).get('meta', {}):
+        requestedMeta = (kwargs.get('fields') or {}).get('meta')
+        if isinstance(requestedMeta, dict) and 'totalCount' in requestedMeta:
             response['meta'] = {'totalCount': queryResult.totalCount}
         return response
 